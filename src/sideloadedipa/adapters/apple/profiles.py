@@ -159,20 +159,27 @@ def next_profile_name(existing: tuple[AppleProfileState, ...], base_name: str) -
     return f"{base_name} {revision}"
 
 
-def _matches_relationships(profile: AppleProfileState, request: ProfileSyncRequest) -> bool:
+def _matches_relationships(
+    profile: AppleProfileState,
+    request: ProfileSyncRequest,
+    device_resource_ids: tuple[str, ...],
+) -> bool:
     return (
         profile.bundle_resource_id == request.bundle_resource_id
         and profile.profile_type == request.validation.profile_type.value
         and profile.profile_state == "ACTIVE"
         and profile.certificate_resource_ids == (request.certificate_resource_id,)
-        and profile.device_resource_ids == tuple(sorted(request.device_resource_ids))
+        and profile.device_resource_ids == device_resource_ids
     )
 
 
 def _matches_create_intent(
-    profile: AppleProfileState, name: str, request: ProfileSyncRequest
+    profile: AppleProfileState,
+    name: str,
+    request: ProfileSyncRequest,
+    device_resource_ids: tuple[str, ...],
 ) -> bool:
-    return profile.name == name and _matches_relationships(profile, request)
+    return profile.name == name and _matches_relationships(profile, request, device_resource_ids)
 
 
 class ProfileReconciler:
@@ -220,9 +227,12 @@ class ProfileReconciler:
         profiles: tuple[AppleProfileState, ...],
         name: str,
         request: ProfileSyncRequest,
+        device_resource_ids: tuple[str, ...],
     ) -> AppleProfileState | None:
         matches = tuple(
-            profile for profile in profiles if _matches_create_intent(profile, name, request)
+            profile
+            for profile in profiles
+            if _matches_create_intent(profile, name, request, device_resource_ids)
         )
         if len(matches) > 1:
             raise AdapterError(
@@ -249,6 +259,8 @@ class ProfileReconciler:
                 bundle_id=request.validation.target_bundle_id,
             )
 
+        # Sorted once per reconciliation rather than once per compared profile.
+        device_resource_ids = tuple(sorted(request.device_resource_ids))
         initial = self.gateway.list() if profiles is None else profiles
         relevant = tuple(
             profile
@@ -257,7 +269,7 @@ class ProfileReconciler:
         )
         validated: list[tuple[AppleProfileState, ProvisioningProfile, bytes]] = []
         for state in relevant:
-            if not _matches_relationships(state, request):
+            if not _matches_relationships(state, request, device_resource_ids):
                 continue
             try:
                 profile, content = self._validated(state, request)
@@ -295,18 +307,20 @@ class ProfileReconciler:
                 profile_type=request.validation.profile_type,
                 bundle_resource_id=request.bundle_resource_id,
                 certificate_resource_id=request.certificate_resource_id,
-                device_resource_ids=tuple(sorted(request.device_resource_ids)),
+                device_resource_ids=device_resource_ids,
             )
         except AdapterError as error:
             if error.code not in _UNCERTAIN_CREATE_ERRORS:
                 raise
-            recovered = self._recover_created(self.gateway.list(), name, request)
+            recovered = self._recover_created(
+                self.gateway.list(), name, request, device_resource_ids
+            )
             if recovered is None:
                 raise
             created = recovered
         else:
             created_candidate = self.gateway.view(resource_id)
-            if not _matches_create_intent(created_candidate, name, request):
+            if not _matches_create_intent(created_candidate, name, request, device_resource_ids):
                 raise AdapterError(
                     ErrorCode.ADAPTER_RESPONSE_INVALID,
                     "created profile was not present with the requested relationships",
@@ -24,6 +24,9 @@ from sideloadedipa.domain import (
 )
 from sideloadedipa.errors import AdapterError, ErrorCode
 
+# Base64 characters hashed per step; a multiple of four keeps every chunk self-contained.
+_CONTENT_DECODE_CHUNK = 64 * 1024
+
 
 class AscStateReader(Protocol):
     def run_json(
@@ -190,8 +193,19 @@ def _decoded_content(value: object, field: str) -> bytes | None:
 
 
 def _content_sha256(value: object, field: str) -> str | None:
-    decoded = _decoded_content(value, field)
-    return None if decoded is None else hashlib.sha256(decoded).hexdigest()
+    encoded = _optional_string(value, field)
+    if encoded is None:
+        return None
+    digest = hashlib.sha256()
+    try:
+        for start in range(0, len(encoded), _CONTENT_DECODE_CHUNK):
+            chunk = encoded[start : start + _CONTENT_DECODE_CHUNK]
+            if "=" in chunk and start + _CONTENT_DECODE_CHUNK < len(encoded):
+                raise binascii.Error("padding before the end of the content")
+            digest.update(base64.b64decode(chunk, validate=True))
+    except (ValueError, binascii.Error) as error:
+        raise _invalid(f"{field} is not valid base64", field) from error
+    return digest.hexdigest()
 
 
 @dataclass(frozen=True, slots=True)
@@ -29,12 +29,14 @@ processed PNGs use Apple's CgBI variant, which no standard decoder accepts.
 from __future__ import annotations
 
 import io
+import plistlib
 import re
 import struct
 import sys
 import urllib.error
 import urllib.parse
 import urllib.request
+import zipfile
 import zlib
 from pathlib import Path
 from typing import Optional
@@ -54,6 +56,8 @@ RAW_HOST = "https://raw.githubusercontent.com"
 # icon_path value selecting the signed IPA as the source.
 IPA_SCHEME = "ipa:"
 
+_APP_INFO_PLIST = re.compile(r"^Payload/[^/]+\.app/Info\.plist$")
+
 
 class IconError(Exception):
     """Raised when an icon cannot be fetched or decoded."""
@@ -129,12 +133,9 @@ def extract_icon_from_ipa(ipa_path: Path) -> bytes:
     than a glob. Full-resolution masters live only inside ``Assets.car``,
     which needs Apple's CoreUI to read, so 152x152 is the practical ceiling.
     """
-    import plistlib
-    import zipfile
-
     with zipfile.ZipFile(ipa_path) as zf:
         names = zf.namelist()
-        plists = [n for n in names if re.match(r"^Payload/[^/]+\.app/Info\.plist$", n)]
+        plists = [n for n in names if _APP_INFO_PLIST.match(n)]
         if not plists:
             raise IconError("No Payload/*.app/Info.plist in IPA")
         plist_name = min(plists, key=len)
@@ -75,6 +75,11 @@ class R2PublicationGateway:
         key = self._store.ipa_key(candidate.slug, candidate.version, immutable_filename)
 
         def upload_and_confirm() -> tuple[str, str]:
+            # Keys are content-addressed, so an unchanged re-publication only needs confirming.
+            if self._store.object_size(key) == path.stat().st_size:
+                stored_sha256 = hashlib.sha256(self._store.download_bytes(key)).hexdigest()
+                if stored_sha256 == candidate.artifact_sha256:
+                    return self._store.public_url(key), stored_sha256
             url = self._store.upload_ipa(path, key)
             stored_sha256 = hashlib.sha256(self._store.download_bytes(key)).hexdigest()
             return url, stored_sha256
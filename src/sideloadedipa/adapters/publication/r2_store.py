@@ -37,9 +37,6 @@ from collections.abc import Mapping
 from pathlib import Path
 from typing import Any, Optional
 
-import boto3
-from botocore.exceptions import ClientError
-
 from sideloadedipa.errors import ConfigurationError, ErrorCode
 
 # Headers for versioned IPA objects: keys are never reused across releases, so
@@ -71,6 +68,9 @@ ICON_CACHE_CONTROL = f"{IPA_CACHE_CONTROL}, no-transform"
 # beyond collision range for a handful of icons per app.
 ICON_DIGEST_LENGTH = 12
 
+# S3 DeleteObjects accepts at most 1000 keys per request.
+DELETE_BATCH_LIMIT = 1000
+
 REQUIRED_ENV_VARS = (
     "R2_ACCOUNT_ID",
     "R2_ACCESS_KEY_ID",
@@ -103,13 +103,18 @@ class R2Store:
         self.public_base_url = public_base_url.rstrip("/")
         self.key_prefix = key_prefix.strip("/") or "apps"
         self.apps_json_key = apps_json_key
-        self._client = client or boto3.client(
-            "s3",
-            endpoint_url=f"https://{account_id}.r2.cloudflarestorage.com",
-            aws_access_key_id=access_key_id,
-            aws_secret_access_key=secret_access_key,
-            region_name=region,
-        )
+        if client is None:
+            # boto3/botocore cost ~150ms to import; only publication commands need them.
+            import boto3
+
+            client = boto3.client(
+                "s3",
+                endpoint_url=f"https://{account_id}.r2.cloudflarestorage.com",
+                aws_access_key_id=access_key_id,
+                aws_secret_access_key=secret_access_key,
+                region_name=region,
+            )
+        self._client = client
 
     @classmethod
     def from_env(
@@ -229,15 +234,30 @@ class R2Store:
         body: bytes = response["Body"].read()
         return body
 
+    def object_size(self, key: str) -> Optional[int]:
+        """Return an object's stored size; ``None`` when the key does not exist."""
+        from botocore.exceptions import ClientError
+
+        try:
+            response = self._client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None
+            raise
+        size: int = response["ContentLength"]
+        return size
+
     def download_json(self, key: str) -> Optional[dict[str, Any]]:
         """Fetch and parse a JSON object; ``None`` when the key does not exist."""
+        from botocore.exceptions import ClientError
+
         try:
             response = self._client.get_object(Bucket=self.bucket, Key=key)
         except ClientError as e:
             if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "NoSuchBucket", "404"):
                 return None
             raise
-        data: dict[str, Any] = json.loads(response["Body"].read().decode("utf-8"))
+        data: dict[str, Any] = json.loads(response["Body"].read())
         return data
 
     # ── stale-version cleanup (D7) ───────────────────────────────────────
@@ -262,22 +282,20 @@ class R2Store:
                 for obj in page.get("Contents", []):
                     keys.append(obj["Key"])
 
-            stale = [key for key in keys if key not in referenced_keys]
-            if not stale:
-                continue
-            self.delete_keys(stale)
-            deleted.extend(stale)
+            deleted.extend(key for key in keys if key not in referenced_keys)
+        # One batched delete for every slug instead of a round trip per slug.
+        self.delete_keys(deleted)
         return deleted
 
     def delete_keys(self, keys: list[str]) -> None:
-        """Delete the given object keys in one batch."""
-        if not keys:
-            return
-        # S3 delete_objects accepts up to 1000 keys per call; our volumes are tiny.
-        self._client.delete_objects(
-            Bucket=self.bucket,
-            Delete={"Objects": [{"Key": key} for key in keys]},
-        )
+        """Delete the given object keys in as few batches as the API allows."""
+        for start in range(0, len(keys), DELETE_BATCH_LIMIT):
+            self._client.delete_objects(
+                Bucket=self.bucket,
+                Delete={
+                    "Objects": [{"Key": key} for key in keys[start : start + DELETE_BATCH_LIMIT]]
+                },
+            )
         for key in keys:
             print(f"[info] Deleted object: {key}")
 
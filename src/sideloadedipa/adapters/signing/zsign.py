@@ -31,6 +31,10 @@ _FEATURES = (
 
 NodeEvidenceCollector = Callable[[SigningPlan, Path], tuple[SigningNodeResult, ...]]
 
+# (executable, digest) pairs whose `zsign -v` output was already qualified. Each task builds
+# its own backend; the digest is re-verified every time, but the version probe runs once.
+_QUALIFIED_EXECUTABLES: set[tuple[str, str]] = set()
+
 
 def _file_sha256(path: Path, *, operation: str) -> str:
     try:
@@ -154,23 +158,26 @@ class ZsignBackend:
                 operation="verify-executable",
                 safe_details=(("actual_sha256", executable_sha256),),
             )
-        result = self.runner.run(
-            [self.executable, "-v"],
-            timeout_seconds=30,
-            path_redactions=(self.executable,),
-        )
-        version_output = result.stdout.strip()
-        if version_output != f"version: {EXPECTED_ZSIGN_VERSION}":
-            raise AdapterError(
-                ErrorCode.ADAPTER_VERSION_MISMATCH,
-                "zsign version does not provide the qualified per-profile entitlement contract",
-                adapter="zsign",
-                operation="verify-version",
-                safe_details=(
-                    ("expected_version", EXPECTED_ZSIGN_VERSION),
-                    ("actual_version", version_output),
-                ),
+        qualified = (str(self.executable.resolve()), executable_sha256)
+        if qualified not in _QUALIFIED_EXECUTABLES:
+            result = self.runner.run(
+                [self.executable, "-v"],
+                timeout_seconds=30,
+                path_redactions=(self.executable,),
             )
+            version_output = result.stdout.strip()
+            if version_output != f"version: {EXPECTED_ZSIGN_VERSION}":
+                raise AdapterError(
+                    ErrorCode.ADAPTER_VERSION_MISMATCH,
+                    "zsign version does not provide the qualified per-profile entitlement contract",
+                    adapter="zsign",
+                    operation="verify-version",
+                    safe_details=(
+                        ("expected_version", EXPECTED_ZSIGN_VERSION),
+                        ("actual_version", version_output),
+                    ),
+                )
+            _QUALIFIED_EXECUTABLES.add(qualified)
         identity = SigningBackendIdentity(
             "zsign",
             EXPECTED_ZSIGN_VERSION,
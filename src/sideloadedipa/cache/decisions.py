@@ -34,6 +34,8 @@ class TaskCacheRecord:
 
 @dataclass(frozen=True, slots=True)
 class CacheIndex:
+    """Digest-bound cache records, always held in task-name order."""
+
     schema_version: int
     records: tuple[TaskCacheRecord, ...]
     index_sha256: str
@@ -58,7 +60,7 @@ def _records_document(records: tuple[TaskCacheRecord, ...]) -> list[dict[str, ob
             "verification_report_sha256": record.verification_report_sha256,
             "signing_report_sha256": record.signing_report_sha256,
         }
-        for record in sorted(records, key=lambda value: value.task_name)
+        for record in records
     ]
 
 
@@ -100,16 +102,21 @@ def parse_cache_index_json(payload: bytes) -> CacheIndex:
         if not isinstance(records_document, list):
             raise TypeError
         records = tuple(
-            TaskCacheRecord(
-                task_name=value["task_name"],
-                fingerprint_schema_version=value["fingerprint_schema_version"],
-                fingerprint_sha256=value["fingerprint_sha256"],
-                artifact_sha256=value["artifact_sha256"],
-                verification_report_sha256=value["verification_report_sha256"],
-                signing_report_sha256=value["signing_report_sha256"],
+            sorted(
+                (
+                    TaskCacheRecord(
+                        task_name=value["task_name"],
+                        fingerprint_schema_version=value["fingerprint_schema_version"],
+                        fingerprint_sha256=value["fingerprint_sha256"],
+                        artifact_sha256=value["artifact_sha256"],
+                        verification_report_sha256=value["verification_report_sha256"],
+                        signing_report_sha256=value["signing_report_sha256"],
+                    )
+                    for value in records_document
+                    if isinstance(value, dict)
+                ),
+                key=lambda value: value.task_name,
             )
-            for value in records_document
-            if isinstance(value, dict)
         )
         if len(records) != len(records_document):
             raise TypeError
@@ -35,9 +35,11 @@ class SigningCacheStore:
         return artifact.with_suffix(".signing-report.json")
 
     def load(self) -> CacheIndex | None:
-        if not self.index_path.exists():
+        try:
+            content = self.index_path.read_bytes()
+        except FileNotFoundError:
             return None
-        return parse_cache_index_json(self.index_path.read_bytes())
+        return parse_cache_index_json(content)
 
     def save(self, index: CacheIndex) -> None:
         payload = canonical_cache_index_json(index) + b"\n"
@@ -6,6 +6,7 @@ import re
 import tomllib
 from collections.abc import Mapping
 from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path, PurePosixPath
 from typing import NoReturn, TypeVar
 from urllib.parse import urlsplit
@@ -24,6 +25,7 @@ from sideloadedipa.domain import (
     TaskConfiguration,
 )
 from sideloadedipa.errors import ConfigurationError, ErrorCode
+from sideloadedipa.util.paths import UNSAFE_PATH_CHARACTERS
 
 _SLUG_PATTERN = re.compile(r"^[A-Za-z0-9._-]+$")
 _BUNDLE_ID_PATTERN = re.compile(r"^[A-Za-z0-9.-]+$")
@@ -32,6 +34,7 @@ _GITHUB_REPOSITORY_PATTERN = re.compile(
 )
 _ALIAS_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9_-]*$")
 _SHA256_PATTERN = re.compile(r"^[0-9a-fA-F]{64}$")
+_UNDERSCORE_RUN_PATTERN = re.compile(r"_+")
 _DIRECT_DIGEST_REMEDIATION = (
     "run 'shasum -a 256 <path-to-ipa>' and add the reviewed digest as ipa_sha256"
 )
@@ -141,8 +144,8 @@ def _https_url(value: str, field: str, task_name: str) -> None:
 
 
 def _slugify(value: str) -> str:
-    slug = re.sub(r"[^A-Za-z0-9._-]+", "_", value.strip())
-    return re.sub(r"_+", "_", slug).strip("._-") or "app"
+    slug = UNSAFE_PATH_CHARACTERS.sub("_", value.strip())
+    return _UNDERSCORE_RUN_PATTERN.sub("_", slug).strip("._-") or "app"
 
 
 def _parse_source(raw: Mapping[str, object], task_name: str) -> SourceConfig:
@@ -380,12 +383,21 @@ def parse_configuration(document: Mapping[str, object]) -> TaskConfiguration:
     return TaskConfiguration(tasks=tasks, r2=r2, publication=publication)
 
 
+@lru_cache(maxsize=8)
+def _parse_content(content: bytes) -> TaskConfiguration:
+    # Keyed on the file contents, so any edit is parsed afresh regardless of stat metadata.
+    return parse_configuration(tomllib.loads(content.decode()))
+
+
 def load_configuration(path: Path) -> TaskConfiguration:
-    """Load and validate a task TOML file."""
+    """Load and validate a task TOML file.
+
+    Parsed configurations are immutable, so repeated loads of identical file
+    contents within one process reuse the first result.
+    """
 
     try:
-        with path.open("rb") as handle:
-            document = tomllib.load(handle)
+        return _parse_content(path.read_bytes())
     except FileNotFoundError as error:
         raise ConfigurationError(
             ErrorCode.CONFIG_MISSING,
@@ -393,10 +405,9 @@ def load_configuration(path: Path) -> TaskConfiguration:
             remediation="provide an existing task configuration path",
             safe_details=(("path", path.name),),
         ) from error
-    except (OSError, tomllib.TOMLDecodeError) as error:
+    except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError) as error:
         raise ConfigurationError(
             ErrorCode.CONFIG_INVALID,
             "configuration file could not be decoded",
             safe_details=(("path", path.name),),
         ) from error
-    return parse_configuration(document)
@@ -49,6 +49,7 @@ class ErrorCode(StrEnum):
     ADAPTER_COMMAND_FAILED = "adapter.command_failed"
     ADAPTER_RESPONSE_INVALID = "adapter.response_invalid"
     ADAPTER_VERSION_MISMATCH = "adapter.version_mismatch"
+    ADAPTER_RATE_LIMITED = "adapter.rate_limited"
     APPLE_AUTHORIZATION_FAILED = "apple.authorization_failed"
     APPLE_RESOURCE_NOT_FOUND = "apple.resource_not_found"
     APPLE_RESOURCE_CONFLICT = "apple.resource_conflict"
@@ -196,6 +196,8 @@ def extract_ipa_safely(
             entries = validate_archive_entries(infos, limits)
             destination.mkdir(parents=True, exist_ok=True)
             destination_root = destination.resolve()
+            # Members of one bundle share parents; create each directory once, not per file.
+            created = {destination}
             for entry in entries:
                 target = destination / Path(*entry.path.parts)
                 if not target.resolve().is_relative_to(destination_root):
@@ -207,8 +209,11 @@ def extract_ipa_safely(
                 if entry.is_directory:
                     target.mkdir(parents=True, exist_ok=True)
                     target.chmod(entry.mode & 0o777 or 0o755)
+                    created.add(target)
                     continue
-                target.parent.mkdir(parents=True, exist_ok=True)
+                if target.parent not in created:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    created.add(target.parent)
                 with archive.open(infos[entry.index]) as source, target.open("xb") as output:
                     shutil.copyfileobj(source, output, length=1024 * 1024)
                 target.chmod(entry.mode & 0o777 or 0o644)
@@ -10,7 +10,6 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-import lief
 from pyasn1.codec.der import decoder
 from pyasn1.error import PyAsn1Error
 from pyasn1.type import char, namedtype, tag, univ
@@ -205,6 +204,8 @@ class LiefEntitlementInspector:
     """Read entitlement evidence without relying on macOS codesign."""
 
     def inspect(self, path: Path) -> MachOEntitlementEvidence:
+        import lief  # imported lazily; only artifact inspection needs the native parser
+
         try:
             parsed = lief.MachO.parse(path, config=lief.MachO.ParserConfig.quick)
         except (OSError, RuntimeError) as error:
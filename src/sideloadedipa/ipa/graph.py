@@ -9,8 +9,6 @@ from dataclasses import replace
 from pathlib import Path, PurePosixPath
 from typing import Protocol
 
-import lief
-
 from sideloadedipa.domain import (
     BundleGraph,
     BundleNode,
@@ -49,6 +47,8 @@ class LiefMachOProbe:
     """Validate thin and fat Mach-O binaries with LIEF's quick parser."""
 
     def is_macho(self, path: Path) -> bool:
+        import lief  # imported lazily so commands that never probe binaries skip its load
+
         try:
             with path.open("rb") as handle:
                 if handle.read(4) not in _MACHO_MAGICS:
@@ -45,7 +45,7 @@ def load_side_effect_journal(path: Path) -> SideEffectJournal:
     if not path.exists():
         return SideEffectJournal()
     try:
-        document = json.loads(path.read_text())
+        document = json.loads(path.read_bytes())
         resources = document["created_apple_resources"]
         committed = document["publication_committed"]
         if (
@@ -63,7 +63,7 @@ def load_side_effect_journal(path: Path) -> SideEffectJournal:
         ]
         if len(created) != len(resources):
             raise TypeError
-    except (OSError, KeyError, TypeError, json.JSONDecodeError) as error:
+    except (OSError, KeyError, TypeError, ValueError) as error:
         raise ConfigurationError(
             ErrorCode.CONFIG_INVALID,
             "side-effect journal is invalid",
@@ -18,8 +18,12 @@ from sideloadedipa.domain import Task, TaskConfiguration
 from sideloadedipa.errors import ConfigurationError, ErrorCode
 from sideloadedipa.pipeline.inspection import InspectDependencies
 from sideloadedipa.pipeline.publication import VerifiedPublicationService
+from sideloadedipa.util.paths import UNSAFE_PATH_CHARACTERS
 
 _DEFAULT_REVALIDATE_URL = "https://itms.zeroclover.io/api/revalidate"
+# Base64 characters decoded per write; a multiple of four keeps every chunk self-contained.
+_P12_DECODE_CHUNK = 64 * 1024
+_UNDERSCORE_RUN_PATTERN = re.compile(r"_+")
 
 
 @dataclass(frozen=True, slots=True)
@@ -64,22 +68,28 @@ def selected_tasks(
 
 def decode_p12(environment: Mapping[str, str], destination: Path) -> str:
     encoded = required_environment(environment, "APPLE_DEV_CERT_P12_ENCODED")
+    descriptor = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
     try:
-        content = base64.b64decode(encoded, validate=True)
+        with os.fdopen(descriptor, "wb") as handle:
+            os.fchmod(handle.fileno(), 0o600)
+            for start in range(0, len(encoded), _P12_DECODE_CHUNK):
+                chunk = encoded[start : start + _P12_DECODE_CHUNK]
+                if "=" in chunk and start + _P12_DECODE_CHUNK < len(encoded):
+                    raise binascii.Error("padding before the end of the payload")
+                handle.write(base64.b64decode(chunk, validate=True))
     except (ValueError, binascii.Error) as error:
+        destination.unlink(missing_ok=True)
         raise ConfigurationError(
             ErrorCode.CONFIG_INVALID,
             "APPLE_DEV_CERT_P12_ENCODED is not valid base64",
             remediation="replace the CI secret with the complete base64-encoded P12",
         ) from error
-    destination.write_bytes(content)
-    destination.chmod(0o600)
     return required_environment(environment, "APPLE_DEV_CERT_PASSWORD")
 
 
 def safe_filename(value: str) -> str:
-    filename = re.sub(r"[^A-Za-z0-9._-]+", "_", value.strip())
-    return re.sub(r"_+", "_", filename).strip("._-") or "app"
+    filename = UNSAFE_PATH_CHARACTERS.sub("_", value.strip())
+    return _UNDERSCORE_RUN_PATTERN.sub("_", filename).strip("._-") or "app"
 
 
 def trigger_revalidation(environment: Mapping[str, str]) -> bool:
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import AbstractContextManager
 from dataclasses import dataclass
 from pathlib import Path
@@ -11,10 +12,12 @@ from urllib.parse import unquote, urlsplit
 
 from sideloadedipa.config import load_configuration
 from sideloadedipa.domain import BundleGraph, BundleNode, SourceKind, Task, TaskConfiguration
-from sideloadedipa.errors import ConfigurationError, DomainError, ErrorCode
+from sideloadedipa.errors import ConfigurationError, DomainError, ErrorCode, SideloadedIPAError
 from sideloadedipa.ipa import discover_bundle_graph, discover_bundle_structure, extract_ipa_safely
 from sideloadedipa.sources import (
     DownloadedSource,
+    GitHubResponseCache,
+    close_api_connections,
     download_source_asset,
     fetch_github_release,
     github_repository_name,
@@ -22,6 +25,10 @@ from sideloadedipa.sources import (
 )
 from sideloadedipa.util.workspace import TaskWorkspace, task_workspace
 
+# Release lookups are pure network waits; a small pool collapses N round trips to a few.
+# GitHub throttles bursts of concurrent requests, so the pool stays deliberately narrow.
+RELEASE_FETCH_WORKERS = 5
+
 
 class ConfigurationLoader(Protocol):
     def __call__(self, path: Path) -> TaskConfiguration: ...
@@ -35,6 +42,7 @@ class ReleaseFetcher(Protocol):
         use_prerelease: bool = False,
         token: str | None = None,
         timeout_seconds: float = 30,
+        cache: GitHubResponseCache | None = None,
     ) -> Mapping[str, object]: ...
 
 
@@ -76,6 +84,7 @@ class InspectDependencies:
     discover_structure: StructureDiscoverer = discover_bundle_structure
     discover: GraphDiscoverer = discover_bundle_graph
     workspace: WorkspaceFactory = task_workspace
+    release_cache: GitHubResponseCache | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -98,8 +107,56 @@ def _release_tag(release: Mapping[str, object]) -> str:
     return value
 
 
+def fetch_releases(
+    tasks: Sequence[Task],
+    dependencies: InspectDependencies,
+    token: str | None,
+    *,
+    max_workers: int = RELEASE_FETCH_WORKERS,
+) -> dict[str, Mapping[str, object] | SideloadedIPAError]:
+    """Fetch release metadata for every GitHub-backed task concurrently.
+
+    Tasks that track the same repository and channel share one API request.
+    Failures are returned per task rather than raised so each one is still
+    attributed to its own task when the caller resolves sources in order.
+    """
+    selected = {
+        task.task_name: (task.source.location, task.source.use_prerelease)
+        for task in tasks
+        if task.source.kind is SourceKind.GITHUB_RELEASE
+    }
+    if not selected:
+        return {}
+    releases = tuple(dict.fromkeys(selected.values()))
+    results: dict[str, Mapping[str, object] | SideloadedIPAError] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(releases)))) as executor:
+        futures = {
+            release: executor.submit(
+                dependencies.fetch_release,
+                release[0],
+                use_prerelease=release[1],
+                token=token,
+                cache=dependencies.release_cache,
+            )
+            for release in releases
+        }
+        for task_name, release in selected.items():
+            try:
+                results[task_name] = futures[release].result()
+            except SideloadedIPAError as error:
+                results[task_name] = error
+    # The pool's threads are gone; their keep-alive sockets would otherwise stay open.
+    close_api_connections()
+    if dependencies.release_cache is not None:
+        dependencies.release_cache.flush()
+    return results
+
+
 def resolve_source(
-    task: Task, dependencies: InspectDependencies, token: str | None
+    task: Task,
+    dependencies: InspectDependencies,
+    token: str | None,
+    release: Mapping[str, object] | None = None,
 ) -> ResolvedSource:
     if task.source.kind is SourceKind.DIRECT_URL:
         if task.source.ipa_sha256 is None:
@@ -136,11 +193,15 @@ def resolve_source(
             safe_details=(("field", "ipa_sha256"),),
         )
 
-    release = dependencies.fetch_release(
-        task.source.location,
-        use_prerelease=task.source.use_prerelease,
-        token=token,
-    )
+    if release is None:
+        release = dependencies.fetch_release(
+            task.source.location,
+            use_prerelease=task.source.use_prerelease,
+            token=token,
+            cache=dependencies.release_cache,
+        )
+        if dependencies.release_cache is not None:
+            dependencies.release_cache.flush()
     asset = select_release_asset(release, task.source.release_glob or "*.ipa")
     return ResolvedSource(
         url=asset.browser_download_url,
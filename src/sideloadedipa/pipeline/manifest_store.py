@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import hashlib
-import re
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -15,12 +14,13 @@ from sideloadedipa.pipeline.stage_manifests import (
     parse_stage_manifest_json,
 )
 from sideloadedipa.util.atomics import atomic_write_bytes
+from sideloadedipa.util.paths import UNSAFE_PATH_CHARACTERS
 
 
 def _path_component(value: str) -> str:
     if not value:
         raise ConfigurationError(ErrorCode.CONFIG_INVALID, "pipeline identity is empty")
-    prefix = re.sub(r"[^A-Za-z0-9._-]+", "_", value).strip("._-")[:48] or "value"
+    prefix = UNSAFE_PATH_CHARACTERS.sub("_", value).strip("._-")[:48] or "value"
     digest = hashlib.sha256(value.encode()).hexdigest()[:12]
     return f"{prefix}-{digest}"
 
@@ -42,10 +42,11 @@ class FileStageManifestStore:
         return self.task_root(task_name) / f"{index:02d}-{stage.value}.json"
 
     def load(self, task_name: str, stage: PipelineStage) -> StageManifest | None:
-        path = self.path(task_name, stage)
-        if not path.exists():
+        try:
+            content = self.path(task_name, stage).read_bytes()
+        except FileNotFoundError:
             return None
-        manifest = parse_stage_manifest_json(path.read_bytes())
+        manifest = parse_stage_manifest_json(content)
         if manifest.task_name != task_name or manifest.stage is not stage:
             raise ConfigurationError(
                 ErrorCode.CONFIG_INVALID,
@@ -40,9 +40,13 @@ from sideloadedipa.pipeline.stages.models import PreparedContext, SourceContext
 from sideloadedipa.pipeline.stages.publication import PublicationStage
 from sideloadedipa.pipeline.stages.results import command_result
 from sideloadedipa.pipeline.stages.signing import SigningStage
-from sideloadedipa.pipeline.stages.source_inventory import SourceInventoryStage
+from sideloadedipa.pipeline.stages.source_inventory import (
+    PrefetchedRelease,
+    SourceInventoryStage,
+)
 from sideloadedipa.pipeline.stages.verification import VerificationStage
 from sideloadedipa.sources.download import DownloadedSource
+from sideloadedipa.sources.github import GitHubResponseCache
 from sideloadedipa.util.atomics import utc_now
 
 
@@ -64,7 +68,20 @@ class ProductionPipeline:
         self.dependencies = dependencies
         self.journal = journal
         self._evidence = StageEvidence(dependencies.manifest_root, dependencies.clock)
-        self._source_inventory = SourceInventoryStage(dependencies.package, self._evidence)
+        inspect = dependencies.package.inspect
+        if inspect.release_cache is None:
+            # One response cache per pipeline, so each batch of revalidations writes it once.
+            inspect = replace(
+                inspect,
+                release_cache=GitHubResponseCache(
+                    dependencies.package.cache_root / "github-releases.json"
+                ),
+            )
+        self._source_inventory = SourceInventoryStage(
+            dependencies.package,
+            self._evidence,
+            inspect,
+        )
         self._apple = AppleStage(dependencies.apple, self._evidence)
         self._signing = SigningStage(dependencies.package, self._evidence)
         self._verification = VerificationStage(
@@ -174,8 +191,9 @@ class ProductionPipeline:
         self,
         request: CommandRequest,
         task: Task,
+        release: PrefetchedRelease | None = None,
     ) -> tuple[ResolvedSource, DownloadedSource, SourceAsset]:
-        return self._source_inventory.resolve_source_asset(request, task)
+        return self._source_inventory.resolve_source_asset(request, task, release)
 
     def _resolve_source(self, request: CommandRequest, task: Task) -> SourceContext:
         return self._source_inventory.resolve(request, task)
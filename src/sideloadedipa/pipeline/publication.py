@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import threading
 from collections.abc import Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -22,6 +24,8 @@ from sideloadedipa.verification import (
 )
 
 _REGISTRY_FIELDS = ("slug", "name", "bundleId", "version", "ipaUrl", "iconUrl")
+# Artifact uploads are independent transfers; the registry still commits once after all of them.
+PUBLICATION_UPLOAD_WORKERS = 4
 
 
 def _publication_error(candidate: PublicationCandidate, message: str) -> DomainError:
@@ -166,42 +170,66 @@ class VerifiedPublicationService:
             if (key := self.gateway.object_key_from_url(candidate.icon_url)) is not None
             if key not in previous_keys
         )
-        artifacts: list[StoredArtifact] = []
-        for candidate in candidates:
+        # Set by the first failed or unconfirmed upload so no further upload starts after it.
+        failed = threading.Event()
+
+        def upload_artifact(candidate: PublicationCandidate) -> StoredArtifact | None:
+            if failed.is_set():
+                return None
             try:
                 artifact = self.gateway.upload_artifact(candidate)
-            except Exception as error:
-                unreferenced_keys = _unreferenced_upload_keys(
-                    self.gateway, current, artifacts, new_icon_keys
-                )
-                try:
-                    self.gateway.delete_uploaded(unreferenced_keys)
-                except Exception as cleanup_error:
-                    raise DomainError(
-                        ErrorCode.PUBLICATION_FAILED,
-                        "immutable artifact upload failed and compensating cleanup was incomplete",
-                        task_name=candidate.task_name,
-                        remediation="delete the reported unreferenced upload keys before retrying",
-                        safe_details=(("unreferenced_keys", unreferenced_keys),),
-                    ) from cleanup_error
-                raise _publication_error(candidate, "immutable artifact upload failed") from error
+            except BaseException:
+                failed.set()
+                raise
             if artifact.sha256 != candidate.artifact_sha256:
+                failed.set()
+            return artifact
+
+        workers = min(PUBLICATION_UPLOAD_WORKERS, len(candidates))
+        uploads: list[Future[StoredArtifact | None]] = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for candidate in candidates:
+                if failed.is_set():
+                    break
+                uploads.append(executor.submit(upload_artifact, candidate))
+        artifacts: list[StoredArtifact] = []
+        failure: tuple[PublicationCandidate, Exception | None] | None = None
+        for candidate, upload in zip(candidates, uploads):
+            error = upload.exception()
+            if error is not None and not isinstance(error, Exception):
+                raise error
+            if error is None:
+                artifact = upload.result()
+                if artifact is None:
+                    continue
                 artifacts.append(artifact)
-                unreferenced_keys = _unreferenced_upload_keys(
-                    self.gateway, current, artifacts, new_icon_keys
-                )
-                try:
-                    self.gateway.delete_uploaded(unreferenced_keys)
-                except Exception as cleanup_error:
-                    raise DomainError(
-                        ErrorCode.PUBLICATION_FAILED,
-                        "uploaded artifact digest differed and compensating cleanup was incomplete",
-                        task_name=candidate.task_name,
-                        remediation="delete the reported unreferenced upload keys before retrying",
-                        safe_details=(("unreferenced_keys", unreferenced_keys),),
-                    ) from cleanup_error
-                raise _publication_error(candidate, "uploaded artifact digest was not confirmed")
-            artifacts.append(artifact)
+                if artifact.sha256 == candidate.artifact_sha256:
+                    continue
+            if failure is None:
+                failure = (candidate, error)
+        if failure is not None:
+            candidate, error = failure
+            cause = (
+                "immutable artifact upload failed"
+                if error is not None
+                else "uploaded artifact digest differed"
+            )
+            unreferenced_keys = _unreferenced_upload_keys(
+                self.gateway, current, artifacts, new_icon_keys
+            )
+            try:
+                self.gateway.delete_uploaded(unreferenced_keys)
+            except Exception as cleanup_error:
+                raise DomainError(
+                    ErrorCode.PUBLICATION_FAILED,
+                    f"{cause} and compensating cleanup was incomplete",
+                    task_name=candidate.task_name,
+                    remediation="delete the reported unreferenced upload keys before retrying",
+                    safe_details=(("unreferenced_keys", unreferenced_keys),),
+                ) from cleanup_error
+            if error is not None:
+                raise _publication_error(candidate, "immutable artifact upload failed") from error
+            raise _publication_error(candidate, "uploaded artifact digest was not confirmed")
 
         document = _merge_registry(current, candidates, artifacts, now=now)
         try:
@@ -5,8 +5,6 @@ from __future__ import annotations
 from collections.abc import Mapping
 from pathlib import Path
 
-from botocore.exceptions import BotoCoreError, ClientError
-
 from sideloadedipa.adapters.publication.icons import IconError, build_icon_png
 from sideloadedipa.adapters.publication.r2_store import R2Store
 from sideloadedipa.domain import (
@@ -31,6 +29,8 @@ def _upload_icon(
 ) -> str | None:
     if task.icon_path is None:
         return None
+    from botocore.exceptions import BotoCoreError, ClientError
+
     try:
         png = build_icon_png(
             task.icon_path,
@@ -16,7 +16,11 @@ from sideloadedipa.cache.fingerprint import (
 from sideloadedipa.domain import BundleGraph, SigningPlan, SourceAsset, Task
 from sideloadedipa.errors import DomainError, ErrorCode
 from sideloadedipa.signing.service import PackageSigningRequest, plan_package_signing
-from sideloadedipa.util.atomics import atomic_write_bytes, canonical_json, file_sha256
+from sideloadedipa.util.atomics import (
+    atomic_write_bytes,
+    canonical_json,
+    stat_cached_file_sha256,
+)
 
 _SIGNING_POLICY_FINGERPRINT_INVARIANTS = {
     "id_strategy": "preserve-source-suffix",
@@ -37,7 +41,8 @@ def template_digests(task: Task, repository_root: Path) -> tuple[tuple[str, str]
         relative = rule.entitlement_policy.template_path
         if relative is None:
             continue
-        values.append((relative.as_posix(), file_sha256(repository_root.joinpath(*relative.parts))))
+        path = repository_root.joinpath(*relative.parts)
+        values.append((relative.as_posix(), stat_cached_file_sha256(path)))
     return tuple(sorted(values))
 
 
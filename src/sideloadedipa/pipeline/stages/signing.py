@@ -6,12 +6,15 @@ import hashlib
 import json
 import tempfile
 from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import AbstractContextManager, contextmanager
 from dataclasses import dataclass, replace
+from datetime import datetime
 from pathlib import Path
 
 from sideloadedipa.application import CommandRequest, CommandResult
 from sideloadedipa.cache.decisions import (
+    CacheIndex,
     RebuildDecision,
     RebuildReason,
     TaskCacheRecord,
@@ -20,7 +23,7 @@ from sideloadedipa.cache.decisions import (
 )
 from sideloadedipa.cache.reuse import CachePrerequisiteState, revalidate_cached_artifact
 from sideloadedipa.cache.store import SigningCacheStore
-from sideloadedipa.domain.pipeline import PipelineStage, VerificationResult
+from sideloadedipa.domain.pipeline import PipelineStage, StageManifest, VerificationResult
 from sideloadedipa.domain.signing import SigningPlan
 from sideloadedipa.errors import ConfigurationError, DomainError, ErrorCode, SideloadedIPAError
 from sideloadedipa.pipeline.environment import (
@@ -40,14 +43,20 @@ from sideloadedipa.signing.profile_validation import DEFAULT_PROFILE_REFRESH_THR
 from sideloadedipa.signing.reports import canonical_signing_report_json
 from sideloadedipa.signing.service import execute_package_signing, plan_package_signing
 from sideloadedipa.util.atomics import (
-    atomic_copy,
+    atomic_link,
     atomic_write_bytes,
     canonical_json,
 )
+
+# Each signing is mostly a zsign subprocess, so a few overlap without oversubscribing CI runners.
+SIGNING_WORKERS = 3
+
 PreparedFactory = Callable[
     [CommandRequest, tuple[SourceContext, ...]],
     AbstractContextManager[tuple[PreparedContext, ...]],
 ]
+# Decision, artifact digest, signing-report digest, and the SIGN window of one task.
+_SignedTask = tuple[RebuildDecision, str, str, datetime, datetime]
 
 
 @dataclass(frozen=True, slots=True)
@@ -147,7 +156,7 @@ class SigningStage:
     def read_decisions(self, request: CommandRequest) -> tuple[RebuildDecision, ...]:
         path = self.evidence.store(request.run_id).run_root / "cache-decisions.json"
         try:
-            values = json.loads(path.read_text())
+            values = json.loads(path.read_bytes())
             return tuple(
                 RebuildDecision(
                     value["task_name"],
@@ -174,7 +183,7 @@ class SigningStage:
         task_name = value.source.task.task_name
         execution = execute_package_signing(value.request, plan)
         artifact = self.cache().artifact_path(task_name, value.fingerprint.sha256)
-        atomic_copy(value.request.destination_ipa, artifact)
+        atomic_link(value.request.destination_ipa, artifact)
         signing_report = canonical_signing_report_json(plan, execution.execution.signing)
         signing_report_sha256 = hashlib.sha256(signing_report).hexdigest()
         atomic_write_bytes(
@@ -184,6 +193,81 @@ class SigningStage:
         atomic_write_bytes(self.signing_report_path(request, task_name), signing_report)
         return execution.execution.signing.output_sha256, signing_report_sha256
 
+    def _sign_prepared(
+        self,
+        request: CommandRequest,
+        value: PreparedContext,
+        decision: RebuildDecision,
+        record: TaskCacheRecord | None,
+    ) -> _SignedTask:
+        task_name = value.source.task.task_name
+        plan = value.plan
+        started_at = self.evidence.clock()
+        # The caller passes the cached record exactly when the decision reuses it.
+        if record is not None:
+            artifact = self.cache().artifact_path(task_name, value.fingerprint.sha256)
+            try:
+                artifact_sha256 = revalidate_cached_artifact(
+                    plan=plan,
+                    cache_record=record,
+                    artifact=artifact,
+                    prerequisites=CachePrerequisiteState(
+                        True,
+                        value.request.profile_manifest.snapshot_sha256,
+                    ),
+                    profiles=value.request.profiles,
+                    now=self.evidence.clock(),
+                    refresh_threshold=DEFAULT_PROFILE_REFRESH_THRESHOLD,
+                )
+                signing_report_sha256 = restore_cached_signing_report(
+                    plan=plan,
+                    record=record,
+                    cached_path=self.cache().signing_report_path(
+                        task_name,
+                        value.fingerprint.sha256,
+                    ),
+                    retained_path=self.signing_report_path(request, task_name),
+                )
+                atomic_link(artifact, value.request.destination_ipa)
+                return (
+                    decision,
+                    artifact_sha256,
+                    signing_report_sha256,
+                    started_at,
+                    self.evidence.clock(),
+                )
+            except (OSError, SideloadedIPAError):
+                decision = RebuildDecision(
+                    task_name,
+                    True,
+                    RebuildReason.CACHE_REJECTED,
+                    value.fingerprint.sha256,
+                    record.artifact_sha256,
+                )
+        artifact_sha256, signing_report_sha256 = self._execute_and_cache(request, value, plan)
+        return decision, artifact_sha256, signing_report_sha256, started_at, self.evidence.clock()
+
+    def _discard_signed(
+        self,
+        prepared: tuple[PreparedContext, ...],
+        futures: list[Future[_SignedTask]],
+        start: int,
+    ) -> None:
+        """Await signings that outlived a failure and remove the cache entries they wrote."""
+
+        for value, future in zip(prepared[start:], futures[start:]):
+            try:
+                decision = future.result()[0]
+            except Exception:
+                continue
+            if decision.rebuild:
+                task_name = value.source.task.task_name
+                cache = self.cache()
+                cache.artifact_path(task_name, value.fingerprint.sha256).unlink(missing_ok=True)
+                cache.signing_report_path(task_name, value.fingerprint.sha256).unlink(
+                    missing_ok=True
+                )
+
     def sign(
         self,
         request: CommandRequest,
@@ -206,100 +290,90 @@ class SigningStage:
                 )
             )
             cached_records = {value.task_name: value for value in cached.records} if cached else {}
+            records = [
+                None if decision.rebuild else cached_records[value.source.task.task_name]
+                for value, decision in zip(prepared, decisions, strict=True)
+            ]
+            workers = max(1, min(SIGNING_WORKERS, len(prepared)))
+            signing_plans: list[StageManifest] = []
+            futures: list[Future[_SignedTask]] = []
             pending_records: list[TaskCacheRecord] = []
-            for index, value in enumerate(prepared):
-                task_name = value.source.task.task_name
-                resource_apply = self.evidence.require(
-                    store,
-                    task_name,
-                    PipelineStage.RESOURCE_APPLY,
-                )
-                plan_started_at = self.evidence.clock()
-                plan = value.plan
-                signing_plan = self.evidence.record_success(
-                    store,
-                    task_name,
-                    PipelineStage.SIGNING_PLAN,
-                    plan.plan_sha256,
-                    resource_apply,
-                    started_at=plan_started_at,
-                )
-                decision = decisions[index]
-                artifact_sha256: str
-                signing_report_sha256: str
-                sign_started_at = self.evidence.clock()
-                if not decision.rebuild:
-                    record = cached_records[task_name]
-                    artifact = self.cache().artifact_path(task_name, value.fingerprint.sha256)
-                    try:
-                        artifact_sha256 = revalidate_cached_artifact(
-                            plan=plan,
-                            cache_record=record,
-                            artifact=artifact,
-                            prerequisites=CachePrerequisiteState(
-                                True,
-                                value.request.profile_manifest.snapshot_sha256,
-                            ),
-                            profiles=value.request.profiles,
-                            now=self.evidence.clock(),
-                            refresh_threshold=DEFAULT_PROFILE_REFRESH_THRESHOLD,
-                        )
-                        signing_report_sha256 = restore_cached_signing_report(
-                            plan=plan,
-                            record=record,
-                            cached_path=self.cache().signing_report_path(
-                                task_name,
-                                value.fingerprint.sha256,
-                            ),
-                            retained_path=self.signing_report_path(request, task_name),
-                        )
-                        atomic_copy(artifact, value.request.destination_ipa)
-                    except (OSError, SideloadedIPAError):
-                        decision = RebuildDecision(
+            # Each task signs in its own workspace; evidence is still recorded in task order,
+            # and a task's SIGNING_PLAN is recorded only as the task is handed to a worker.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+
+                def submit(index: int) -> None:
+                    value = prepared[index]
+                    task_name = value.source.task.task_name
+                    resource_apply = self.evidence.require(
+                        store,
+                        task_name,
+                        PipelineStage.RESOURCE_APPLY,
+                    )
+                    plan_started_at = self.evidence.clock()
+                    signing_plans.append(
+                        self.evidence.record_success(
+                            store,
                             task_name,
-                            True,
-                            RebuildReason.CACHE_REJECTED,
-                            value.fingerprint.sha256,
-                            record.artifact_sha256,
+                            PipelineStage.SIGNING_PLAN,
+                            value.plan.plan_sha256,
+                            resource_apply,
+                            started_at=plan_started_at,
                         )
-                        decisions[index] = decision
-                        artifact_sha256, signing_report_sha256 = self._execute_and_cache(
+                    )
+                    futures.append(
+                        executor.submit(
+                            self._sign_prepared,
                             request,
                             value,
-                            plan,
+                            decisions[index],
+                            records[index],
                         )
-                else:
-                    artifact_sha256, signing_report_sha256 = self._execute_and_cache(
-                        request,
-                        value,
-                        plan,
-                    )
-                self.evidence.record_success(
-                    store,
-                    task_name,
-                    PipelineStage.SIGN,
-                    artifact_sha256,
-                    signing_plan,
-                    started_at=sign_started_at,
-                )
-                pending_records.append(
-                    TaskCacheRecord(
-                        task_name,
-                        value.fingerprint.schema_version,
-                        value.fingerprint.sha256,
-                        artifact_sha256,
-                        None,
-                        signing_report_sha256,
                     )
-                )
+
+                index = 0
+                try:
+                    for upcoming in range(min(workers, len(prepared))):
+                        submit(upcoming)
+                    for index, value in enumerate(prepared):
+                        task_name = value.source.task.task_name
+                        (
+                            decisions[index],
+                            artifact_sha256,
+                            signing_report_sha256,
+                            sign_started_at,
+                            sign_completed_at,
+                        ) = futures[index].result()
+                        self.evidence.record_success(
+                            store,
+                            task_name,
+                            PipelineStage.SIGN,
+                            artifact_sha256,
+                            signing_plans[index],
+                            started_at=sign_started_at,
+                            completed_at=sign_completed_at,
+                        )
+                        pending_records.append(
+                            TaskCacheRecord(
+                                task_name,
+                                value.fingerprint.schema_version,
+                                value.fingerprint.sha256,
+                                artifact_sha256,
+                                None,
+                                signing_report_sha256,
+                            )
+                        )
+                        if index + workers < len(prepared):
+                            submit(index + workers)
+                except BaseException:
+                    # Fail fast: nothing more is submitted, and signings already running are
+                    # awaited so their cache writes can be discarded, as if they never ran.
+                    self._discard_signed(prepared, futures, index + 1)
+                    raise
             decisions_tuple = tuple(decisions)
             self.write_decisions(request, decisions_tuple)
-            existing = (
-                {record.task_name: record for record in cached.records}
-                if cached is not None
-                else {}
-            )
-            existing.update({record.task_name: record for record in pending_records})
+            pending_by_task = {record.task_name: record for record in pending_records}
+            existing = {**cached_records, **pending_by_task}
             self.pending_cache(request).save(build_cache_index(tuple(existing.values())))
         return command_result(
             "sign",
@@ -310,11 +384,9 @@ class SigningStage:
                         "task_name": value.task_name,
                         "rebuild": value.rebuild,
                         "reason": value.reason.value,
-                        "signing_report_sha256": next(
-                            record.signing_report_sha256
-                            for record in pending_records
-                            if record.task_name == value.task_name
-                        ),
+                        "signing_report_sha256": pending_by_task[
+                            value.task_name
+                        ].signing_report_sha256,
                     }
                     for value in decisions_tuple
                 ],
@@ -326,7 +398,7 @@ class SigningStage:
         self,
         request: CommandRequest,
         verifications: Mapping[str, VerificationResult],
-    ) -> None:
+    ) -> CacheIndex:
         pending = self.pending_cache(request).load()
         if pending is None:
             raise ConfigurationError(
@@ -352,21 +424,21 @@ class SigningStage:
                     verification_report_sha256=verification.report_sha256,
                 )
             )
-        missing = sorted(
-            task_name
-            for task_name in verifications
-            if not any(record.task_name == task_name for record in pending.records)
-        )
+        missing = sorted(verifications.keys() - {record.task_name for record in pending.records})
         if missing:
             raise DomainError(
                 ErrorCode.PIPELINE_TRANSITION_INVALID,
                 "verification has no matching pending cache record",
                 safe_details=(("task_names", tuple(missing)),),
             )
-        self.pending_cache(request).save(build_cache_index(tuple(records)))
+        verified = build_cache_index(tuple(records))
+        self.pending_cache(request).save(verified)
+        return verified
 
-    def promote_cache(self, request: CommandRequest) -> None:
-        pending = self.pending_cache(request).load()
+    def promote_cache(self, request: CommandRequest, pending: CacheIndex | None = None) -> None:
+        """Promote the verified pending index, reusing it when the caller just wrote it."""
+        if pending is None:
+            pending = self.pending_cache(request).load()
         if pending is None:
             raise ConfigurationError(
                 ErrorCode.CONFIG_MISSING,
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import asdict, dataclass
+from datetime import datetime
 from pathlib import Path
 
 from sideloadedipa.application import CommandRequest
@@ -12,7 +14,13 @@ from sideloadedipa.domain.pipeline import PipelineStage, SourceAsset, StageManif
 from sideloadedipa.errors import DomainError, ErrorCode, SideloadedIPAError
 from sideloadedipa.pipeline.environment import PipelineEnvironmentDependencies
 from sideloadedipa.pipeline.input_manifests import CanonicalInputManifestStore
-from sideloadedipa.pipeline.inspection import ResolvedSource, resolve_source
+from sideloadedipa.pipeline.inspection import (
+    InspectDependencies,
+    ResolvedSource,
+    fetch_releases,
+    resolve_source,
+)
+from sideloadedipa.pipeline.manifest_store import FileStageManifestStore
 from sideloadedipa.pipeline.package_runner import inspect_source_graph
 from sideloadedipa.pipeline.sign_stage import json_digest, policy_sha256
 from sideloadedipa.pipeline.source_state import (
@@ -25,19 +33,38 @@ from sideloadedipa.pipeline.source_state import (
 from sideloadedipa.pipeline.stages.evidence import StageEvidence
 from sideloadedipa.pipeline.stages.models import SourceContext
 from sideloadedipa.signing.preflight import validate_signing_preflight
-from sideloadedipa.sources.download import DownloadedSource
+from sideloadedipa.sources.download import DownloadedSource, SourceArtifactCache
 from sideloadedipa.util.atomics import file_sha256
 
+# Release metadata fetched for the batch, or the error that fetch raised for one task.
+PrefetchedRelease = Mapping[str, object] | SideloadedIPAError
 SourceResolver = Callable[
-    [CommandRequest, Task],
+    [CommandRequest, Task, PrefetchedRelease | None],
     tuple[ResolvedSource, DownloadedSource, SourceAsset],
 ]
+# Sources downloaded ahead of the task being inventoried; each holds one IPA on disk.
+SOURCE_DOWNLOAD_WORKERS = 3
+_TimedResolution = tuple[datetime, tuple[ResolvedSource, DownloadedSource, SourceAsset], datetime]
+
+
+def _asset_identity(resolved: ResolvedSource) -> str | None:
+    """Immutable upstream identity for a release asset that publishes no digest."""
+
+    asset_id = resolved.evidence.get("asset_id")
+    if asset_id is None or resolved.advertised_size is None:
+        return None
+    # GitHub never rewrites an asset in place; replacing it issues a new asset id.
+    return f"{resolved.url}#{asset_id}:{resolved.advertised_size}"
 
 
 @dataclass(frozen=True, slots=True)
 class SourceInventoryStage:
     package: PipelineEnvironmentDependencies
     evidence: StageEvidence
+    dependencies: InspectDependencies
+
+    def source_cache(self) -> SourceArtifactCache:
+        return SourceArtifactCache(self.package.cache_root)
 
     def inputs(self, request: CommandRequest) -> CanonicalInputManifestStore:
         return CanonicalInputManifestStore(self.evidence.store(request.run_id))
@@ -54,37 +81,73 @@ class SourceInventoryStage:
         self,
         request: CommandRequest,
         task: Task,
+        release: PrefetchedRelease | None = None,
     ) -> tuple[ResolvedSource, DownloadedSource, SourceAsset]:
-        dependencies = self.package.inspect
+        dependencies = self.dependencies
         path = self.source_path(request, task)
         selection_path = self.selection_path(request, task)
-        if path.exists():
+        try:
+            size: int | None = path.stat().st_size
+        except FileNotFoundError:
+            size = None
+        if size is not None:
             resolved = read_source_selection(selection_path)
-            digest = file_sha256(path)
             attempts = resolved.evidence.get("download_attempts", 1)
             downloaded = DownloadedSource(
                 path,
-                path.stat().st_size,
-                digest,
+                size,
+                file_sha256(path),
                 attempts if isinstance(attempts, int) else 1,
             )
             validate_downloaded_source(resolved, downloaded)
         else:
+            if isinstance(release, SideloadedIPAError):
+                raise release
             resolved = resolve_source(
                 task,
                 dependencies,
                 self.package.environment.get("GITHUB_TOKEN"),
+                release,
             )
-            downloaded = dependencies.download(
-                resolved.url,
+            cache = self.source_cache()
+            identity = None if resolved.expected_sha256 is not None else _asset_identity(resolved)
+            restored = cache.restore(
+                task.task_name,
                 path,
-                expected_sha256=resolved.expected_sha256,
+                expected_sha256=(
+                    resolved.expected_sha256
+                    if identity is None
+                    else cache.learned_digest(task.task_name, identity)
+                ),
                 expected_size=resolved.advertised_size,
             )
+            if restored is None:
+                downloaded = dependencies.download(
+                    resolved.url,
+                    path,
+                    expected_sha256=resolved.expected_sha256,
+                    expected_size=resolved.advertised_size,
+                )
+                if resolved.expected_sha256 is not None or identity is not None:
+                    cache.store(task.task_name, downloaded, identity=identity)
+            else:
+                downloaded = restored
             resolved = bind_download_evidence(resolved, downloaded)
             write_source_selection(selection_path, resolved)
         return resolved, downloaded, source_asset(resolved, downloaded)
 
+    def fetch_pending_releases(
+        self,
+        request: CommandRequest,
+        tasks: list[Task],
+    ) -> dict[str, PrefetchedRelease]:
+        """Fetch release metadata concurrently for tasks whose source is not yet on disk."""
+        return fetch_releases(
+            [task for task in tasks if not self.source_path(request, task).exists()],
+            self.dependencies,
+            self.package.environment.get("GITHUB_TOKEN"),
+        )
+
     def resolve(self, request: CommandRequest, task: Task) -> SourceContext:
         source_started_at = self.evidence.clock()
         resolved, downloaded, source = self.resolve_source_asset(request, task)
@@ -147,6 +210,23 @@ class SourceInventoryStage:
     ) -> tuple[SourceContext, ...]:
         return tuple(self.load_context(request, task) for task in tasks)
 
+    def _needs_source(self, store: FileStageManifestStore, task: Task) -> bool:
+        try:
+            return store.load(task.task_name, PipelineStage.SOURCE) is None
+        except SideloadedIPAError:
+            return False
+
+    def _timed_resolution(
+        self,
+        resolver: SourceResolver,
+        request: CommandRequest,
+        task: Task,
+        release: PrefetchedRelease | None,
+    ) -> _TimedResolution:
+        started_at = self.evidence.clock()
+        resolution = resolver(request, task, release)
+        return started_at, resolution, self.evidence.clock()
+
     def inspect(
         self,
         request: CommandRequest,
@@ -159,147 +239,193 @@ class SourceInventoryStage:
         diagnostics: list[str] = []
         repository_root = request.config_path.resolve().parent.parent
         resolver = resolve_asset or self.resolve_source_asset
-        for task in tasks:
-            task_started_at = self.evidence.clock()
-            source_manifest: StageManifest | None = None
-            inventory_manifest: StageManifest | None = None
-            try:
-                source_manifest = store.load(task.task_name, PipelineStage.SOURCE)
-                inventory_manifest = store.load(task.task_name, PipelineStage.INVENTORY)
-                if inventory_manifest is not None:
-                    canonical = inputs.load(task)
-                    resolved = canonical.resolved
-                    downloaded = canonical.downloaded
-                    source = canonical.source
-                    graph = canonical.graph
-                    source_manifest = self.evidence.require(
-                        store, task.task_name, PipelineStage.SOURCE
-                    )
-                    inventory_manifest = self.evidence.require(
-                        store, task.task_name, PipelineStage.INVENTORY
+        needs_source = [task.task_name for task in tasks if self._needs_source(store, task)]
+        by_name = {task.task_name: task for task in tasks}
+        # Fetched once for the batch, before any task's SOURCE window opens.
+        releases = self.fetch_pending_releases(request, [by_name[name] for name in needs_source])
+        prefetched: dict[str, Future[_TimedResolution]] = {}
+        submitted: set[str] = set()
+        prefetcher = ThreadPoolExecutor(max_workers=SOURCE_DOWNLOAD_WORKERS)
+
+        def prefetch_after(task: Task) -> None:
+            if task.task_name not in needs_source:
+                return
+            following = needs_source.index(task.task_name) + 1
+            for name in needs_source[following : following + SOURCE_DOWNLOAD_WORKERS]:
+                if name not in submitted:
+                    submitted.add(name)
+                    prefetched[name] = prefetcher.submit(
+                        self._timed_resolution,
+                        resolver,
+                        request,
+                        by_name[name],
+                        releases.get(name),
                     )
-                else:
-                    if source_manifest is None:
-                        source_started_at = self.evidence.clock()
-                        resolved, downloaded, source = resolver(request, task)
-                        source_completed_at = self.evidence.clock()
-                        source_manifest = self.evidence.record_success(
+
+        with prefetcher:
+            try:
+                for task in tasks:
+                    task_started_at = self.evidence.clock()
+                    source_manifest: StageManifest | None = None
+                    inventory_manifest: StageManifest | None = None
+                    try:
+                        source_manifest = store.load(task.task_name, PipelineStage.SOURCE)
+                        inventory_manifest = store.load(task.task_name, PipelineStage.INVENTORY)
+                        if inventory_manifest is not None:
+                            canonical = inputs.load(task)
+                            resolved = canonical.resolved
+                            downloaded = canonical.downloaded
+                            source = canonical.source
+                            graph = canonical.graph
+                            source_manifest = self.evidence.require(
+                                store, task.task_name, PipelineStage.SOURCE
+                            )
+                            inventory_manifest = self.evidence.require(
+                                store, task.task_name, PipelineStage.INVENTORY
+                            )
+                        else:
+                            if source_manifest is None:
+                                upcoming = prefetched.pop(task.task_name, None)
+                                if upcoming is None:
+                                    try:
+                                        timed = self._timed_resolution(
+                                            resolver, request, task, releases.get(task.task_name)
+                                        )
+                                    finally:
+                                        prefetch_after(task)
+                                else:
+                                    prefetch_after(task)
+                                    timed = upcoming.result()
+                                (
+                                    source_started_at,
+                                    (resolved, downloaded, source),
+                                    source_completed_at,
+                                ) = timed
+                                # A prefetched download may have run during the previous task; its
+                                # SOURCE window still opens no earlier than this task does.
+                                source_started_at = max(source_started_at, task_started_at)
+                                source_completed_at = max(source_completed_at, source_started_at)
+                                source_manifest = self.evidence.record_success(
+                                    store,
+                                    task.task_name,
+                                    PipelineStage.SOURCE,
+                                    json_digest(asdict(source)),
+                                    None,
+                                    started_at=source_started_at,
+                                    completed_at=source_completed_at,
+                                )
+                                source_input = inputs.save_source(
+                                    task=task,
+                                    resolved=resolved,
+                                    downloaded=downloaded,
+                                    source=source,
+                                    source_stage=source_manifest,
+                                )
+                            else:
+                                source_manifest = self.evidence.require(
+                                    store, task.task_name, PipelineStage.SOURCE
+                                )
+                                source_input, resolved, downloaded = inputs.load_source(task)
+                                source = source_input.source
+                            inventory_started_at = self.evidence.clock()
+                            graph = inspect_source_graph(
+                                downloaded.path,
+                                source_sha256=downloaded.sha256,
+                                task=task,
+                            )
+                            inventory_completed_at = self.evidence.clock()
+                            inventory_manifest = self.evidence.record_success(
+                                store,
+                                task.task_name,
+                                PipelineStage.INVENTORY,
+                                graph.graph_sha256,
+                                source_manifest,
+                                started_at=inventory_started_at,
+                                completed_at=inventory_completed_at,
+                            )
+                            inputs.save_inventory(
+                                task=task,
+                                source_manifest=source_input,
+                                graph=graph,
+                                inventory_stage=inventory_manifest,
+                            )
+                        context = SourceContext(
+                            task,
+                            resolved,
+                            downloaded,
+                            source,
+                            graph,
+                            source_manifest.started_at,
+                            source_manifest.completed_at,
+                            inventory_manifest.started_at,
+                            inventory_manifest.completed_at,
+                        )
+                        policy_started_at = self.evidence.clock()
+                        preflight = validate_signing_preflight(
+                            task,
+                            context.graph,
+                            repository_root=repository_root,
+                            team_id="PREFLIGHTTEAM",
+                            app_identifier_prefix="PREFLIGHTPREFIX.",
+                        )
+                        if not preflight.valid:
+                            error = DomainError(
+                                ErrorCode.SIGNING_PLAN_INVALID,
+                                "current source inventory does not satisfy its signing policy",
+                                task_name=task.task_name,
+                                safe_details=(
+                                    (
+                                        "diagnostic_codes",
+                                        tuple(value.code for value in preflight.diagnostics),
+                                    ),
+                                ),
+                            )
+                            self.evidence.record_failure(
+                                store,
+                                task.task_name,
+                                PipelineStage.POLICY,
+                                error,
+                                inventory_manifest,
+                                started_at=policy_started_at,
+                            )
+                            diagnostics.extend(
+                                f"{task.task_name}:{value.code}" for value in preflight.diagnostics
+                            )
+                            continue
+                        self.evidence.record_success(
                             store,
                             task.task_name,
-                            PipelineStage.SOURCE,
-                            json_digest(asdict(source)),
-                            None,
-                            started_at=source_started_at,
-                            completed_at=source_completed_at,
-                        )
-                        source_input = inputs.save_source(
-                            task=task,
-                            resolved=resolved,
-                            downloaded=downloaded,
-                            source=source,
-                            source_stage=source_manifest,
+                            PipelineStage.POLICY,
+                            json_digest(
+                                {"policy": policy_sha256(task), "graph": context.graph.graph_sha256}
+                            ),
+                            inventory_manifest,
+                            started_at=policy_started_at,
                         )
-                    else:
-                        source_manifest = self.evidence.require(
-                            store, task.task_name, PipelineStage.SOURCE
+                        contexts.append(context)
+                    except SideloadedIPAError as error:
+                        if source_manifest is None:
+                            stage = PipelineStage.SOURCE
+                            predecessor = None
+                        elif inventory_manifest is None:
+                            stage = PipelineStage.INVENTORY
+                            predecessor = source_manifest
+                        else:
+                            stage = PipelineStage.POLICY
+                            predecessor = inventory_manifest
+                        self.evidence.record_failure(
+                            store,
+                            task.task_name,
+                            stage,
+                            error,
+                            predecessor,
+                            started_at=task_started_at,
                         )
-                        source_input, resolved, downloaded = inputs.load_source(task)
-                        source = source_input.source
-                    inventory_started_at = self.evidence.clock()
-                    graph = inspect_source_graph(
-                        downloaded.path,
-                        source_sha256=downloaded.sha256,
-                        task=task,
-                    )
-                    inventory_completed_at = self.evidence.clock()
-                    inventory_manifest = self.evidence.record_success(
-                        store,
-                        task.task_name,
-                        PipelineStage.INVENTORY,
-                        graph.graph_sha256,
-                        source_manifest,
-                        started_at=inventory_started_at,
-                        completed_at=inventory_completed_at,
-                    )
-                    inputs.save_inventory(
-                        task=task,
-                        source_manifest=source_input,
-                        graph=graph,
-                        inventory_stage=inventory_manifest,
-                    )
-                context = SourceContext(
-                    task,
-                    resolved,
-                    downloaded,
-                    source,
-                    graph,
-                    source_manifest.started_at,
-                    source_manifest.completed_at,
-                    inventory_manifest.started_at,
-                    inventory_manifest.completed_at,
-                )
-                policy_started_at = self.evidence.clock()
-                preflight = validate_signing_preflight(
-                    task,
-                    context.graph,
-                    repository_root=repository_root,
-                    team_id="PREFLIGHTTEAM",
-                    app_identifier_prefix="PREFLIGHTPREFIX.",
-                )
-                if not preflight.valid:
-                    error = DomainError(
-                        ErrorCode.SIGNING_PLAN_INVALID,
-                        "current source inventory does not satisfy its signing policy",
-                        task_name=task.task_name,
-                        safe_details=(
-                            (
-                                "diagnostic_codes",
-                                tuple(value.code for value in preflight.diagnostics),
-                            ),
-                        ),
-                    )
-                    self.evidence.record_failure(
-                        store,
-                        task.task_name,
-                        PipelineStage.POLICY,
-                        error,
-                        inventory_manifest,
-                        started_at=policy_started_at,
-                    )
-                    diagnostics.extend(
-                        f"{task.task_name}:{value.code}" for value in preflight.diagnostics
-                    )
-                    continue
-                self.evidence.record_success(
-                    store,
-                    task.task_name,
-                    PipelineStage.POLICY,
-                    json_digest(
-                        {"policy": policy_sha256(task), "graph": context.graph.graph_sha256}
-                    ),
-                    inventory_manifest,
-                    started_at=policy_started_at,
-                )
-                contexts.append(context)
-            except SideloadedIPAError as error:
-                if source_manifest is None:
-                    stage = PipelineStage.SOURCE
-                    predecessor = None
-                elif inventory_manifest is None:
-                    stage = PipelineStage.INVENTORY
-                    predecessor = source_manifest
-                else:
-                    stage = PipelineStage.POLICY
-                    predecessor = inventory_manifest
-                self.evidence.record_failure(
-                    store,
-                    task.task_name,
-                    stage,
-                    error,
-                    predecessor,
-                    started_at=task_started_at,
-                )
-                diagnostics.append(f"{task.task_name}:{error.code.value}")
+                        diagnostics.append(f"{task.task_name}:{error.code.value}")
+            except BaseException:
+                # Fail fast: queued downloads are dropped instead of run into the cache.
+                prefetcher.shutdown(cancel_futures=True)
+                raise
         if diagnostics:
             raise DomainError(
                 ErrorCode.SIGNING_PLAN_INVALID,
@@ -24,6 +24,8 @@ from sideloadedipa.verification import (
     parse_verification_report_json,
 )
 
+_SECRET_KEY_MARKERS = ("SECRET", "PASSWORD", "PRIVATE", "P12", "TOKEN")
+
 
 @dataclass(frozen=True, slots=True)
 class VerificationStage:
@@ -107,8 +109,7 @@ class VerificationStage:
         redactions = tuple(
             value
             for key, value in environment.items()
-            if value
-            and any(token in key for token in ("SECRET", "PASSWORD", "PRIVATE", "P12", "TOKEN"))
+            if value and any(token in key for token in _SECRET_KEY_MARKERS)
         )
         write_run_report(
             path,
@@ -169,9 +170,9 @@ class VerificationStage:
                     signing,
                     started_at=stage_started_at,
                 )
-            self.signing.record_verifications(request, verifications)
+            verified_cache = self.signing.record_verifications(request, verifications)
             if not request.publish:
-                self.signing.promote_cache(request)
+                self.signing.promote_cache(request, verified_cache)
             report = self.write_report(request, prepared, verifications)
         return command_result(
             "verify",
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 import stat
+import threading
 import zipfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, replace
 from pathlib import Path, PurePosixPath
 
@@ -25,6 +29,8 @@ from sideloadedipa.util.workspace import task_workspace
 
 _ZIP_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
 _COPY_BUFFER_BYTES = 1024 * 1024
+_WORKSPACE_BASES: dict[Path, tuple[int, bool]] = {}
+_WORKSPACE_BASES_LOCK = threading.Lock()
 
 
 @dataclass(frozen=True, slots=True)
@@ -153,6 +159,35 @@ def _validate_backend_result(
         )
 
 
+@contextmanager
+def _shared_workspace_base(path: Path) -> Iterator[None]:
+    """Hold a workspace base open; the last concurrent user removes it if it was created."""
+
+    with _WORKSPACE_BASES_LOCK:
+        users, created = _WORKSPACE_BASES.get(path, (0, not path.exists()))
+        path.mkdir(parents=True, exist_ok=True)
+        _WORKSPACE_BASES[path] = (users + 1, created)
+    try:
+        yield
+    finally:
+        with _WORKSPACE_BASES_LOCK:
+            users, created = _WORKSPACE_BASES.pop(path)
+            if users > 1:
+                _WORKSPACE_BASES[path] = (users - 1, created)
+            elif created:
+                try:
+                    path.rmdir()
+                except OSError:
+                    pass
+
+
+def _same_file(first: Path, second: Path) -> bool:
+    try:
+        return os.path.samefile(first, second)
+    except FileNotFoundError:
+        return False
+
+
 def execute_signing_plan(
     *,
     plan: SigningPlan,
@@ -163,34 +198,32 @@ def execute_signing_plan(
 ) -> SigningExecutionResult:
     """Sign an isolated copy and expose it after backend-evidence validation."""
 
-    if source_ipa.resolve() == destination_ipa.resolve():
+    if _same_file(source_ipa, destination_ipa):
         raise _execution_error(plan, "source and destination IPA paths must be different")
     if file_sha256(source_ipa) != plan.source_ipa_sha256:
         raise _execution_error(plan, "source IPA digest does not match the signing plan")
 
     destination_ipa.parent.mkdir(parents=True, exist_ok=True)
     workspace_base = destination_ipa.parent / ".sideloadedipa-signing"
-    remove_workspace_base = not workspace_base.exists()
-    try:
-        with task_workspace(workspace_base, plan.task_name) as workspace:
+    with (
+        _shared_workspace_base(workspace_base),
+        task_workspace(workspace_base, plan.task_name) as workspace,
+    ):
+        try:
+            os.link(source_ipa, workspace.source_ipa)
+        except OSError:
             shutil.copy2(source_ipa, workspace.source_ipa)
-            if file_sha256(workspace.source_ipa) != plan.source_ipa_sha256:
-                raise _execution_error(plan, "workspace source copy digest changed")
+        if file_sha256(workspace.source_ipa) != plan.source_ipa_sha256:
+            raise _execution_error(plan, "workspace source copy digest changed")
 
-            extract_ipa_safely(workspace.source_ipa, workspace.extracted)
-            rewrites = rewrite_bundle_identifiers(workspace.extracted, plan)
-            prepared_ipa = workspace.root / "prepared.ipa"
-            package_workspace_ipa(workspace.extracted, prepared_ipa)
+        extract_ipa_safely(workspace.source_ipa, workspace.extracted)
+        rewrites = rewrite_bundle_identifiers(workspace.extracted, plan)
+        prepared_ipa = workspace.root / "prepared.ipa"
+        package_workspace_ipa(workspace.extracted, prepared_ipa)
 
-            signing = backend.sign(plan, prepared_ipa, workspace.output_ipa, certificate)
-            _validate_backend_result(plan, signing, workspace.output_ipa)
+        signing = backend.sign(plan, prepared_ipa, workspace.output_ipa, certificate)
+        _validate_backend_result(plan, signing, workspace.output_ipa)
 
-            workspace.output_ipa.replace(destination_ipa)
-            promoted = replace(signing, output_path=PurePosixPath(destination_ipa.name))
-            return SigningExecutionResult(promoted, rewrites)
-    finally:
-        if remove_workspace_base:
-            try:
-                workspace_base.rmdir()
-            except OSError:
-                pass
+        workspace.output_ipa.replace(destination_ipa)
+        promoted = replace(signing, output_path=PurePosixPath(destination_ipa.name))
+        return SigningExecutionResult(promoted, rewrites)
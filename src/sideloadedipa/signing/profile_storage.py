@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import hashlib
 import json
-import re
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path, PurePosixPath
@@ -13,10 +12,11 @@ from typing import cast
 from sideloadedipa.domain import ProfileManifestEntry, ProfileResourceManifest
 from sideloadedipa.errors import DomainError, ErrorCode
 from sideloadedipa.util.atomics import atomic_write_bytes, canonical_json
+from sideloadedipa.util.paths import UNSAFE_PATH_CHARACTERS
 
 
 def _component(value: str) -> str:
-    readable = re.sub(r"[^A-Za-z0-9._-]+", "-", value).strip(".-") or "item"
+    readable = UNSAFE_PATH_CHARACTERS.sub("-", value).strip(".-") or "item"
     digest = hashlib.sha256(value.encode()).hexdigest()[:12]
     return f"{readable}-{digest}"
 
@@ -209,6 +209,17 @@ def _destination(root: Path, relative_path: PurePosixPath) -> Path:
 
 
 def _atomic_write(destination: Path, content: bytes) -> None:
+    # Unchanged profiles are the common sync outcome; skip the tempfile, fsync and replace.
+    try:
+        status = destination.stat()
+        if (
+            status.st_mode & 0o777 == 0o600
+            and status.st_size == len(content)
+            and destination.read_bytes() == content
+        ):
+            return
+    except OSError:
+        pass
     atomic_write_bytes(destination, content)
 
 
@@ -4,10 +4,13 @@ from sideloadedipa.sources.download import (
     DEFAULT_DOWNLOAD_POLICY,
     DownloadedSource,
     DownloadPolicy,
+    SourceArtifactCache,
     download_source_asset,
 )
 from sideloadedipa.sources.github import (
     GitHubReleaseAsset,
+    GitHubResponseCache,
+    close_api_connections,
     fetch_github_release,
     github_repository_name,
     select_release_asset,
@@ -18,6 +21,9 @@ __all__ = [
     "DownloadedSource",
     "DownloadPolicy",
     "GitHubReleaseAsset",
+    "GitHubResponseCache",
+    "SourceArtifactCache",
+    "close_api_connections",
     "download_source_asset",
     "fetch_github_release",
     "github_repository_name",
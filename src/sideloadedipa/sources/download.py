@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import os
 import re
+import ssl
 import tempfile
 import time
 from collections.abc import Callable, Mapping
@@ -14,9 +16,15 @@ from pathlib import Path
 from typing import IO, Protocol, cast
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlsplit
-from urllib.request import HTTPRedirectHandler, Request, build_opener
+from urllib.request import HTTPRedirectHandler, HTTPSHandler, Request, build_opener
 
 from sideloadedipa.errors import AdapterError, DomainError, ErrorCode
+from sideloadedipa.util.atomics import (
+    atomic_link,
+    atomic_write_bytes,
+    canonical_json,
+    file_sha256,
+)
 
 _SHA256_PATTERN = re.compile(r"^[0-9a-fA-F]{64}$")
 _RETRYABLE_HTTP_STATUS = frozenset({408, 429, 500, 502, 503, 504})
@@ -114,8 +122,14 @@ class _HttpsOnlyRedirectHandler(HTTPRedirectHandler):
         return super().redirect_request(req, fp, code, msg, headers, newurl)
 
 
+# Built once: every source download and retry shares the same HTTPS-only handler chain and
+# one TLS context, so the CA store is loaded once rather than per connection.
+_TLS_CONTEXT = ssl.create_default_context()
+_OPENER = build_opener(_HttpsOnlyRedirectHandler(), HTTPSHandler(context=_TLS_CONTEXT))
+
+
 def _open_url(request: Request, timeout_seconds: float) -> DownloadResponse:
-    response = build_opener(_HttpsOnlyRedirectHandler()).open(
+    response = _OPENER.open(
         request,
         timeout=timeout_seconds,
     )
@@ -222,6 +236,86 @@ def _stream_to_file(
             temporary_path.unlink(missing_ok=True)
 
 
+@dataclass(frozen=True, slots=True)
+class SourceArtifactCache:
+    """Last verified source per task, keyed by content digest, reused across runs."""
+
+    root: Path
+
+    def _task_root(self, task_name: str) -> Path:
+        task_digest = hashlib.sha256(task_name.encode()).hexdigest()[:16]
+        return self.root / "source-artifacts" / task_digest
+
+    def artifact_path(self, task_name: str, sha256: str) -> Path:
+        return self._task_root(task_name) / f"{sha256}.ipa"
+
+    def restore(
+        self,
+        task_name: str,
+        destination: Path,
+        *,
+        expected_sha256: str | None,
+        expected_size: int | None = None,
+        policy: DownloadPolicy = DEFAULT_DOWNLOAD_POLICY,
+    ) -> DownloadedSource | None:
+        """Materialize a cached source when its reviewed digest is already known."""
+
+        expected = _normalize_digest(expected_sha256)
+        if expected is None:
+            return None
+        cached = self.artifact_path(task_name, expected)
+        try:
+            size = cached.stat().st_size
+        except FileNotFoundError:
+            return None
+        if (expected_size is not None and size != expected_size) or size > policy.maximum_bytes:
+            return None
+        atomic_link(cached, destination, mode=0o444)
+        # The cache is only a transfer shortcut; the bytes are re-verified every time.
+        if file_sha256(destination) != expected:
+            destination.unlink()
+            cached.unlink(missing_ok=True)
+            return None
+        return DownloadedSource(path=destination, size=size, sha256=expected)
+
+    def identity_path(self, task_name: str) -> Path:
+        return self._task_root(task_name) / "identity.json"
+
+    def learned_digest(self, task_name: str, identity: str) -> str | None:
+        """Digest observed for an upstream identity that publishes no digest of its own."""
+
+        try:
+            document = json.loads(self.identity_path(task_name).read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(document, dict) or document.get("identity") != identity:
+            return None
+        digest = document.get("sha256")
+        return digest if isinstance(digest, str) and _SHA256_PATTERN.fullmatch(digest) else None
+
+    def store(
+        self,
+        task_name: str,
+        downloaded: DownloadedSource,
+        *,
+        identity: str | None = None,
+    ) -> None:
+        """Keep one verified source per task, replacing the previous release."""
+
+        target = self.artifact_path(task_name, downloaded.sha256)
+        atomic_link(downloaded.path, target, mode=0o444)
+        kept = {target}
+        if identity is not None:
+            kept.add(self.identity_path(task_name))
+            atomic_write_bytes(
+                self.identity_path(task_name),
+                canonical_json({"identity": identity, "sha256": downloaded.sha256}),
+            )
+        for sibling in target.parent.iterdir():
+            if sibling not in kept:
+                sibling.unlink(missing_ok=True)
+
+
 def _transport_failure(status: int | None = None) -> AdapterError:
     details = (("status", status),) if status is not None else ()
     return AdapterError(
@@ -5,17 +5,48 @@ from __future__ import annotations
 import fnmatch
 import json
 import re
-from collections.abc import Mapping
-from dataclasses import dataclass
+import ssl
+import threading
+import time
+import zlib
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from email.message import Message
+from functools import lru_cache
+from http.client import HTTPException, HTTPResponse, HTTPSConnection
+from pathlib import Path
 from urllib.error import HTTPError, URLError
 from urllib.parse import quote, urlsplit
 from urllib.request import Request, urlopen
 
 from sideloadedipa.errors import AdapterError, DomainError, ErrorCode
+from sideloadedipa.util.atomics import atomic_write_bytes
+from sideloadedipa.util.retrying import RetryOperation, RetryPolicy, retry_call
 
 _API_VERSION = "2026-03-10"
 _MAX_RESPONSE_BYTES = 16 * 1024 * 1024
+# Compressed bytes read per inflate step; a release list is usually a few such reads.
+_GZIP_READ_BYTES = 64 * 1024
 _SHA256_DIGEST = re.compile(r"^sha256:[0-9a-fA-F]{64}$")
+_API_HOST = "api.github.com"
+# Prereleases are nearly always among the newest few releases; past that, use /latest.
+_PRERELEASE_PAGE_SIZE = 10
+_GITHUB_URL_PREFIXES = ("https://github.com/", "http://github.com/")
+_REDIRECT_STATUS = frozenset({301, 302, 303, 307, 308})
+_TRANSIENT_STATUS = frozenset({429, 500, 502, 503, 504})
+_RETRY_POLICY = RetryPolicy(max_attempts=3, base_delay_seconds=1.0, max_delay_seconds=8.0)
+# Longer primary rate-limit resets fail fast instead of stalling the whole run.
+_MAX_RATE_LIMIT_WAIT_SECONDS = 60.0
+# Below this share of the reported quota, requests are spread over the rest of the window.
+# The quota is 60 calls an hour without a token and 5000 with one, so the floor scales.
+_RATE_LIMIT_BUFFER_FRACTION = 0.1
+# One keep-alive connection per thread so concurrent release checks reuse TLS sessions.
+_CONNECTIONS = threading.local()
+# Every connection handed to a thread, so callers that own a worker pool can close them.
+_OPEN_CONNECTIONS: set[HTTPSConnection] = set()
+_OPEN_CONNECTIONS_LOCK = threading.Lock()
+# Shared by every per-thread connection so the CA store is loaded once, not per reconnect.
+_TLS_CONTEXT = ssl.create_default_context()
 
 
 @dataclass(frozen=True, slots=True)
@@ -37,11 +68,21 @@ def _invalid_release(message: str, field: str) -> DomainError:
     )
 
 
+@lru_cache(maxsize=256)
 def github_repository_name(repository_url: str) -> str:
-    """Return a safe owner/repository name from a validated GitHub URL."""
+    """Return a safe owner/repository name from a validated GitHub URL.
+
+    The result is memoized because inspection, release lookup, and icon
+    resolution each parse the same configured URLs.
+    """
 
     if repository_url.startswith("git@github.com:"):
         path = repository_url.removeprefix("git@github.com:")
+    elif repository_url.startswith(_GITHUB_URL_PREFIXES) and not any(
+        delimiter in repository_url for delimiter in "?#\t\r\n"
+    ):
+        # Configured URLs are plain https://github.com/owner/repo; skip urlsplit for them.
+        path = repository_url.partition("github.com/")[2]
     else:
         parsed = urlsplit(repository_url)
         if parsed.scheme not in {"http", "https"} or parsed.hostname != "github.com":
@@ -53,11 +94,303 @@ def github_repository_name(repository_url: str) -> str:
     return f"{parts[0]}/{parts[1]}"
 
 
-def _read_json(request: Request, *, timeout_seconds: float) -> object:
+_CACHED_RELEASE_FIELDS = frozenset({"tag_name", "published_at", "draft", "prerelease", "assets"})
+_CACHED_ASSET_FIELDS = frozenset({"id", "name", "browser_download_url", "size", "digest"})
+
+
+def _cacheable_release(body: object) -> object:
+    """Drop release notes, uploader objects, and other fields the package never reads."""
+
+    if isinstance(body, list):
+        return [_cacheable_release(value) for value in body]
+    if not isinstance(body, dict):
+        return body
+    release = {key: value for key, value in body.items() if key in _CACHED_RELEASE_FIELDS}
+    assets = release.get("assets")
+    if isinstance(assets, list):
+        release["assets"] = [
+            (
+                {key: value for key, value in asset.items() if key in _CACHED_ASSET_FIELDS}
+                if isinstance(asset, dict)
+                else asset
+            )
+            for asset in assets
+        ]
+    return release
+
+
+@dataclass(slots=True)
+class GitHubResponseCache:
+    """Persisted ETag validators so unchanged releases are answered with 304.
+
+    Only the release fields the package reads are kept. Stores stay in memory
+    until ``flush`` writes the file once for the whole batch of lookups.
+    """
+
+    path: Path
+    _entries: dict[str, tuple[str, object]] | None = field(default=None, repr=False)
+    _dirty: bool = field(default=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def _load(self) -> dict[str, tuple[str, object]]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                document = json.loads(self.path.read_bytes())
+            except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+                document = None
+            entries = document.get("entries") if isinstance(document, dict) else None
+            if isinstance(entries, dict):
+                for endpoint, entry in entries.items():
+                    if isinstance(entry, dict) and isinstance(entry.get("etag"), str):
+                        self._entries[endpoint] = (entry["etag"], entry.get("body"))
+        return self._entries
+
+    def lookup(self, endpoint: str) -> tuple[str, object] | None:
+        with self._lock:
+            return self._load().get(endpoint)
+
+    def store(self, endpoint: str, etag: str, body: object) -> None:
+        with self._lock:
+            self._load()[endpoint] = (etag, _cacheable_release(body))
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Atomically persist stored entries if any changed since the last flush."""
+
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = self._load()
+            document = {
+                "schema_version": 1,
+                "entries": {
+                    key: {"etag": value[0], "body": value[1]} for key, value in entries.items()
+                },
+            }
+            # Not a digest input: skip key sorting and ASCII escaping of release bodies.
+            payload = json.dumps(document, ensure_ascii=False, separators=(",", ":"))
+            atomic_write_bytes(self.path, payload.encode() + b"\n")
+            self._dirty = False
+
+
+@dataclass(slots=True)
+class _RateLimitBudget:
+    """Last primary rate-limit window reported by api.github.com, shared by all threads."""
+
+    limit: int | None = None
+    remaining: int | None = None
+    reset_at: float = 0.0
+    next_slot: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def observe(self, headers: Message) -> None:
+        try:
+            limit = int(headers.get("X-RateLimit-Limit", ""))
+            remaining = int(headers.get("X-RateLimit-Remaining", ""))
+            reset_at = float(headers.get("X-RateLimit-Reset", ""))
+        except ValueError:
+            return
+        with self._lock:
+            self.limit, self.remaining, self.reset_at = limit, remaining, reset_at
+
+    def reserve(self, now: float) -> float:
+        """Claim the next paced request slot and return how long to wait for it.
+
+        Slots are handed out one interval apart under the lock, so concurrent
+        workers together keep the pace a single caller would. A caller whose
+        slot would fall after the window resets fails instead of queueing.
+        """
+
+        with self._lock:
+            limit, remaining, reset_at = self.limit, self.remaining, self.reset_at
+            if (
+                limit is None
+                or remaining is None
+                or remaining >= limit * _RATE_LIMIT_BUFFER_FRACTION
+                or reset_at <= now
+            ):
+                return 0.0
+            interval = min((reset_at - now) / max(remaining, 1), _MAX_RATE_LIMIT_WAIT_SECONDS)
+            slot = max(now, self.next_slot) + interval
+            if slot > reset_at:
+                raise AdapterError(
+                    ErrorCode.ADAPTER_RATE_LIMITED,
+                    "GitHub API rate limit is exhausted for the current window",
+                    adapter="github-rest",
+                    operation="read-release",
+                    remediation="set GITHUB_TOKEN or retry after the rate-limit window resets",
+                    safe_details=(("remaining", remaining),),
+                )
+            self.next_slot = slot
+            return slot - now
+
+
+_RATE_LIMIT = _RateLimitBudget()
+
+
+def _api_connection(timeout_seconds: float) -> HTTPSConnection:
+    connection: HTTPSConnection | None = getattr(_CONNECTIONS, "api", None)
+    if connection is None:
+        connection = HTTPSConnection(_API_HOST, timeout=timeout_seconds, context=_TLS_CONTEXT)
+        _CONNECTIONS.api = connection
+    # Registered on every use: a closed connection reopens its socket on the next request.
+    with _OPEN_CONNECTIONS_LOCK:
+        _OPEN_CONNECTIONS.add(connection)
+    connection.timeout = timeout_seconds
+    return connection
+
+
+def _drop_api_connection() -> None:
+    connection: HTTPSConnection | None = getattr(_CONNECTIONS, "api", None)
+    _CONNECTIONS.api = None
+    if connection is not None:
+        with _OPEN_CONNECTIONS_LOCK:
+            _OPEN_CONNECTIONS.discard(connection)
+        connection.close()
+
+
+def close_api_connections() -> None:
+    """Close every API connection opened so far, including those of finished worker threads."""
+
+    with _OPEN_CONNECTIONS_LOCK:
+        connections = tuple(_OPEN_CONNECTIONS)
+        _OPEN_CONNECTIONS.clear()
+    for connection in connections:
+        connection.close()
+
+
+def _open_api(request: Request, *, timeout: float) -> HTTPResponse:
+    """Send an API request over this thread's persistent api.github.com connection."""
+
+    parsed = urlsplit(request.full_url)
+    if parsed.scheme != "https" or parsed.hostname != _API_HOST or parsed.port is not None:
+        return urlopen(request, timeout=timeout)  # type: ignore[no-any-return]
+    target = f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
+    headers = dict(request.header_items())
+    for attempt in range(2):
+        connection = _api_connection(timeout)
+        try:
+            connection.request("GET", target, headers=headers)
+            response = connection.getresponse()
+            _RATE_LIMIT.observe(response.headers)
+            break
+        except (HTTPException, OSError) as error:
+            # An idle keep-alive socket may have been closed by the server; retry once.
+            _drop_api_connection()
+            if attempt:
+                raise URLError(error) from error
+    if response.status < 300:
+        return response
+    response.read()
+    if response.status in _REDIRECT_STATUS:
+        return urlopen(request, timeout=timeout)  # type: ignore[no-any-return]
+    raise HTTPError(request.full_url, response.status, response.reason, response.headers, None)
+
+
+def _rate_limit_wait(error: Exception, now: float) -> float | None:
+    """Return the wait GitHub advised for a throttled request, if it gave one."""
+
+    if not isinstance(error, HTTPError) or error.code not in {403, 429} or error.headers is None:
+        return None
     try:
-        with urlopen(request, timeout=timeout_seconds) as response:
-            payload = response.read(_MAX_RESPONSE_BYTES + 1)
+        retry_after = error.headers.get("Retry-After")
+        if retry_after is not None:
+            return max(0.0, float(retry_after))
+        if error.headers.get("X-RateLimit-Remaining") == "0":
+            return max(0.0, float(error.headers.get("X-RateLimit-Reset", "")) - now)
+    except ValueError:
+        return None
+    return None
+
+
+def _transient_github_error(error: Exception, now: float) -> bool:
+    if not isinstance(error, HTTPError):
+        return False
+    wait = _rate_limit_wait(error, now)
+    if wait is not None:
+        return wait <= _MAX_RATE_LIMIT_WAIT_SECONDS
+    return error.code in _TRANSIENT_STATUS
+
+
+def _invalid_gzip() -> AdapterError:
+    return AdapterError(
+        ErrorCode.ADAPTER_RESPONSE_INVALID,
+        "GitHub release response is not valid gzip",
+        adapter="github-rest",
+        operation="decode-release",
+    )
+
+
+def _gunzip(response: HTTPResponse) -> bytes:
+    """Inflate a gzip-encoded body, stopping one byte past the response limit."""
+
+    inflater = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+    payload = bytearray()
+    try:
+        while len(payload) <= _MAX_RESPONSE_BYTES and (chunk := response.read(_GZIP_READ_BYTES)):
+            payload += inflater.decompress(chunk, _MAX_RESPONSE_BYTES + 1 - len(payload))
+    except zlib.error as error:
+        raise _invalid_gzip() from error
+    if len(payload) <= _MAX_RESPONSE_BYTES and not inflater.eof:
+        raise _invalid_gzip()
+    return bytes(payload)
+
+
+def _read_body(response: HTTPResponse) -> bytes:
+    """Read at most the response limit of the decoded body, dropping the rest."""
+
+    if response.headers.get("Content-Encoding") == "gzip":
+        payload = _gunzip(response)
+    else:
+        payload = response.read(_MAX_RESPONSE_BYTES + 1)
+    if len(payload) > _MAX_RESPONSE_BYTES:
+        raise AdapterError(
+            ErrorCode.ADAPTER_RESPONSE_INVALID,
+            "GitHub release response exceeds the configured limit",
+            adapter="github-rest",
+            operation="read-release",
+        )
+    return payload
+
+
+def _read_json(
+    request: Request,
+    *,
+    timeout_seconds: float,
+    cache: GitHubResponseCache | None = None,
+    clock: Callable[[], float] = time.time,
+    sleep: Callable[[float], None] = time.sleep,
+) -> object:
+    cached = cache.lookup(request.full_url) if cache is not None else None
+    if cached is not None:
+        request.add_header("If-None-Match", cached[0])
+
+    def send() -> tuple[bytes, str | None]:
+        if delay := _RATE_LIMIT.reserve(clock()):
+            sleep(delay)
+        with _open_api(request, timeout=timeout_seconds) as response:
+            try:
+                payload = _read_body(response)
+            except AdapterError:
+                # The unread remainder of the body would corrupt the next keep-alive request.
+                _drop_api_connection()
+                raise
+            return payload, response.headers.get("ETag") if cache is not None else None
+
+    try:
+        payload, etag = retry_call(
+            operation_id=f"read:{request.full_url}",
+            operation=RetryOperation.READ,
+            action=send,
+            is_transient=lambda error: _transient_github_error(error, clock()),
+            policy=_RETRY_POLICY,
+            sleep=sleep,
+            advised_delay=lambda error: _rate_limit_wait(error, clock()),
+        )
     except (HTTPError, URLError, OSError) as error:
+        if cached is not None and isinstance(error, HTTPError) and error.code == 304:
+            return cached[1]
         status = error.code if isinstance(error, HTTPError) else None
         details = (("status", status),) if status is not None else ()
         raise AdapterError(
@@ -68,15 +401,8 @@ def _read_json(request: Request, *, timeout_seconds: float) -> object:
             remediation="retry or verify repository access and GitHub API availability",
             safe_details=details,
         ) from error
-    if len(payload) > _MAX_RESPONSE_BYTES:
-        raise AdapterError(
-            ErrorCode.ADAPTER_RESPONSE_INVALID,
-            "GitHub release response exceeds the configured limit",
-            adapter="github-rest",
-            operation="read-release",
-        )
     try:
-        return json.loads(payload)
+        decoded = json.loads(payload)
     except (UnicodeDecodeError, json.JSONDecodeError) as error:
         raise AdapterError(
             ErrorCode.ADAPTER_RESPONSE_INVALID,
@@ -84,6 +410,9 @@ def _read_json(request: Request, *, timeout_seconds: float) -> object:
             adapter="github-rest",
             operation="decode-release",
         ) from error
+    if cache is not None and etag:
+        cache.store(request.full_url, etag, decoded)
+    return decoded
 
 
 def fetch_github_release(
@@ -92,41 +421,64 @@ def fetch_github_release(
     use_prerelease: bool = False,
     token: str | None = None,
     timeout_seconds: float = 30,
+    cache: GitHubResponseCache | None = None,
+    clock: Callable[[], float] = time.time,
+    sleep: Callable[[float], None] = time.sleep,
 ) -> Mapping[str, object]:
     """Fetch the latest stable release or newest published prerelease."""
 
     repository = github_repository_name(repository_url)
     encoded_repository = "/".join(quote(part, safe="") for part in repository.split("/"))
     endpoint = f"https://api.github.com/repos/{encoded_repository}/releases"
-    endpoint += "?per_page=100" if use_prerelease else "/latest"
     headers = {
         "Accept": "application/vnd.github+json",
+        # Release lists carry full release notes; gzip shrinks them several-fold on the wire.
+        "Accept-Encoding": "gzip",
         "User-Agent": "SideloadedIPA/1",
         "X-GitHub-Api-Version": _API_VERSION,
     }
     if token:
         headers["Authorization"] = f"Bearer {token}"
-    decoded = _read_json(Request(endpoint, headers=headers), timeout_seconds=timeout_seconds)
-    selected: object
+    selected: object = None
     if use_prerelease:
+        decoded = _read_json(
+            Request(f"{endpoint}?per_page={_PRERELEASE_PAGE_SIZE}", headers=headers),
+            timeout_seconds=timeout_seconds,
+            cache=cache,
+            clock=clock,
+            sleep=sleep,
+        )
         if not isinstance(decoded, list):
             raise _invalid_release("release list must be an array", "release")
-        candidates = [
-            release
-            for release in decoded
-            if isinstance(release, Mapping) and release.get("draft") is False
-        ]
         selected = next(
-            (release for release in candidates if release.get("prerelease") is True),
-            candidates[0] if candidates else None,
+            (
+                release
+                for release in decoded
+                if isinstance(release, Mapping)
+                and release.get("draft") is False
+                and release.get("prerelease") is True
+            ),
+            None,
+        )
+    if selected is None:
+        selected = _read_json(
+            Request(f"{endpoint}/latest", headers=headers),
+            timeout_seconds=timeout_seconds,
+            cache=cache,
+            clock=clock,
+            sleep=sleep,
         )
-    else:
-        selected = decoded
     if not isinstance(selected, Mapping):
         raise _invalid_release("release response must contain a release object", "release")
     return selected
 
 
+@lru_cache(maxsize=64)
+def _glob_matcher(glob_pattern: str) -> Callable[[str], re.Match[str] | None]:
+    # Compile each glob once rather than paying fnmatch's per-call normcase and cache lookup.
+    return re.compile(fnmatch.translate(glob_pattern)).match
+
+
 def select_release_asset(release: Mapping[str, object], glob_pattern: str) -> GitHubReleaseAsset:
     """Select exactly one matching IPA asset and retain source evidence."""
 
@@ -145,7 +497,8 @@ def select_release_asset(release: Mapping[str, object], glob_pattern: str) -> Gi
             )
         assets.append((index, raw_asset, name))
 
-    matches = [asset for asset in assets if fnmatch.fnmatch(asset[2], glob_pattern)]
+    matcher = _glob_matcher(glob_pattern)
+    matches = [asset for asset in assets if matcher(asset[2])]
     if not matches:
         raise DomainError(
             ErrorCode.SOURCE_ASSET_NOT_FOUND,
@@ -44,11 +44,8 @@ FIXED_ZIP_TIME = (2026, 7, 21, 0, 0, 0)
 
 
 def sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
     with path.open("rb") as handle:
-        for block in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(block)
-    return digest.hexdigest()
+        return hashlib.file_digest(handle, "sha256").hexdigest()
 
 
 def info_plist(executable: str, identifier: str, package_type: str) -> bytes:
@@ -24,7 +24,7 @@ class ComparisonError(RuntimeError):
 
 
 def load_summary(path: Path) -> dict[str, Any]:
-    value = json.loads(path.read_text())
+    value = json.loads(path.read_bytes())
     if not isinstance(value, dict):
         raise ComparisonError(f"summary {path.name} is not an object")
     return value
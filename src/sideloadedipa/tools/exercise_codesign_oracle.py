@@ -21,6 +21,8 @@ from sideloadedipa.tools.exercise_zsign_backend import (
     sha256_bytes,
 )
 
+_DER_ENTITLEMENT_SLOT = re.compile(r"^\s*-7=([0-9a-fA-F]{64})$", re.MULTILINE)
+
 
 class CodesignOracleError(RuntimeError):
     """The macOS oracle could not produce trustworthy evidence."""
@@ -66,11 +68,8 @@ def signing_order() -> list[str]:
 
 
 def sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
     with path.open("rb") as handle:
-        for block in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(block)
-    return digest.hexdigest()
+        return hashlib.file_digest(handle, "sha256").hexdigest()
 
 
 def string_values(value: Any) -> list[str]:
@@ -103,7 +102,7 @@ def inspect_codesign_entitlements(bundle: Path, expected: Mapping[str, Any]) ->
     details = run(["codesign", "--display", "--verbose=5", str(bundle)]).stderr.decode(
         errors="replace"
     )
-    slot = re.search(r"^\s*-7=([0-9a-fA-F]{64})$", details, re.MULTILINE)
+    slot = _DER_ENTITLEMENT_SLOT.search(details)
     if slot is None or set(slot.group(1)) == {"0"}:
         raise CodesignOracleError(f"codesign emitted no DER entitlement slot for {bundle.name}")
 
@@ -175,9 +174,10 @@ def exercise(args: CodesignOracleRequest) -> dict[str, Any]:
     for role, (bundle_path, _, _) in TARGETS.items():
         bundle = extracted / bundle_path
         embedded_profile = bundle / "embedded.mobileprovision"
+        embedded_sha256 = sha256_file(embedded_profile)
         profiles[role] = {
-            "embedded_profile_sha256": sha256_file(embedded_profile),
-            "profile_matches_input": sha256_file(embedded_profile) == profile_hashes[role],
+            "embedded_profile_sha256": embedded_sha256,
+            "profile_matches_input": embedded_sha256 == profile_hashes[role],
             "profile_resource_seal_matches": profile_resource_seal_matches(
                 bundle, embedded_profile.read_bytes()
             ),
@@ -5,12 +5,15 @@ from __future__ import annotations
 import hashlib
 import json
 import plistlib
+import re
 import subprocess
 import zipfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Mapping, Sequence, cast
 
+_SIGN_FOLDER_LINE = re.compile(r"^.*SignFolder:.*$", re.MULTILINE)
+
 TARGETS = {
     "root": (
         "Payload/Qualification.app",
@@ -135,9 +138,7 @@ def run(
 def signing_order(output: str) -> list[str]:
     markers = {role: Path(bundle_path).name for role, (bundle_path, _, _) in TARGETS.items()}
     order: list[str] = []
-    for line in output.splitlines():
-        if "SignFolder:" not in line:
-            continue
+    for line in _SIGN_FOLDER_LINE.findall(output):
         for role, marker in markers.items():
             if marker in line and role not in order:
                 order.append(role)
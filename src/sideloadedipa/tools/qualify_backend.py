@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import platform
@@ -103,8 +104,6 @@ class QualificationDependencies:
 
 
 def _digest(value: object) -> str:
-    import hashlib
-
     return hashlib.sha256(canonical_json(value, default=str)).hexdigest()
 
 
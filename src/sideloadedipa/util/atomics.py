@@ -6,13 +6,19 @@ import hashlib
 import json
 import os
 import shutil
+import stat
 import tempfile
+import threading
 from collections.abc import Callable, Sequence
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import IO
 
 from sideloadedipa.domain import Diagnostic, thaw_json
 
+# Bytes requested per sendfile call; most IPAs copy in one or two calls.
+_SENDFILE_CHUNK = 64 * 1024 * 1024
+
 
 def utc_now() -> datetime:
     return datetime.now(timezone.utc)
@@ -32,11 +38,31 @@ def canonical_json(
 
 
 def file_sha256(path: Path) -> str:
-    digest = hashlib.sha256()
+    # file_digest reads into one reusable buffer and hashes without holding the GIL.
     with path.open("rb") as handle:
-        for block in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(block)
-    return digest.hexdigest()
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+_STAT_DIGESTS: dict[tuple[str, int, int, int, int], str] = {}
+_STAT_DIGESTS_LOCK = threading.Lock()
+
+
+def stat_cached_file_sha256(path: Path) -> str:
+    """Return a file digest, reusing it while the file's identity and mtime are unchanged.
+
+    Only for trusted repository inputs; integrity gates must keep using file_sha256.
+    """
+    resolved = path.resolve()
+    status = resolved.stat()
+    key = (str(resolved), status.st_dev, status.st_ino, status.st_size, status.st_mtime_ns)
+    with _STAT_DIGESTS_LOCK:
+        cached = _STAT_DIGESTS.get(key)
+    if cached is not None:
+        return cached
+    digest = file_sha256(resolved)
+    with _STAT_DIGESTS_LOCK:
+        _STAT_DIGESTS[key] = digest
+    return digest
 
 
 def _sync_parent(path: Path) -> None:
@@ -70,6 +96,19 @@ def atomic_write_bytes(path: Path, content: bytes, *, mode: int = 0o600) -> None
             temporary.unlink(missing_ok=True)
 
 
+def _copy_contents(source: IO[bytes], destination: IO[bytes]) -> None:
+    # sendfile keeps the bytes in the kernel; platforms or filesystems that refuse it on the
+    # first call fall back to the buffered loop.
+    offset = 0
+    try:
+        while sent := os.sendfile(destination.fileno(), source.fileno(), offset, _SENDFILE_CHUNK):
+            offset += sent
+    except (AttributeError, OSError):
+        if offset:
+            raise
+        shutil.copyfileobj(source, destination)
+
+
 def atomic_copy(source: Path, destination: Path, *, mode: int = 0o600) -> None:
     destination.parent.mkdir(parents=True, exist_ok=True)
     temporary: Path | None = None
@@ -84,7 +123,7 @@ def atomic_copy(source: Path, destination: Path, *, mode: int = 0o600) -> None:
             ) as destination_handle,
         ):
             temporary = Path(destination_handle.name)
-            shutil.copyfileobj(source_handle, destination_handle)
+            _copy_contents(source_handle, destination_handle)
             destination_handle.flush()
             os.fsync(destination_handle.fileno())
         temporary.chmod(mode)
@@ -96,6 +135,39 @@ def atomic_copy(source: Path, destination: Path, *, mode: int = 0o600) -> None:
             temporary.unlink(missing_ok=True)
 
 
+def atomic_link(source: Path, destination: Path, *, mode: int = 0o600) -> None:
+    """Publish ``source`` at ``destination`` by hardlink, copying only when linking fails.
+
+    Both names share one inode afterwards, so neither may be rewritten in place. A source whose
+    mode differs from ``mode`` is copied instead, because a link cannot change one name's mode
+    without changing the other's.
+    """
+
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    if stat.S_IMODE(source.stat().st_mode) != mode:
+        atomic_copy(source, destination, mode=mode)
+        return
+    while True:
+        # Unique per call: concurrent workers may publish the same destination.
+        temporary = Path(
+            tempfile.mktemp(prefix=f".{destination.name}.", suffix=".link", dir=destination.parent)
+        )
+        try:
+            os.link(source, temporary)
+        except FileExistsError:
+            continue
+        except OSError:
+            atomic_copy(source, destination, mode=mode)
+            return
+        break
+    try:
+        os.replace(temporary, destination)
+        _sync_parent(destination)
+    finally:
+        # rename(2) is a no-op when both names already share the inode.
+        temporary.unlink(missing_ok=True)
+
+
 def redact_text(value: str, redactions: Sequence[str]) -> str:
     for literal in sorted((item for item in redactions if item), key=len, reverse=True):
         value = value.replace(literal, "***")
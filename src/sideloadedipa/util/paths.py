@@ -0,0 +1,8 @@
+"""Filesystem-safe naming helpers."""
+
+from __future__ import annotations
+
+import re
+
+# Runs of characters outside the portable filename set; callers choose the replacement.
+UNSAFE_PATH_CHARACTERS = re.compile(r"[^A-Za-z0-9._-]+")
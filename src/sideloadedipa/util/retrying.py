@@ -44,8 +44,13 @@ def retry_call(
     policy: RetryPolicy = RetryPolicy(),
     sleep: Callable[[float], None] = time.sleep,
     random_unit: Callable[[], float] = random.random,
+    advised_delay: Callable[[Exception], float | None] | None = None,
 ) -> T:
-    """Retry one safe operation without changing its identity or arguments."""
+    """Retry one safe operation without changing its identity or arguments.
+
+    ``advised_delay`` lets an adapter honour a server-provided wait, such as an
+    HTTP ``Retry-After`` header, in place of the jittered backoff.
+    """
 
     if not operation_id:
         raise ValueError("retry operation identity must be non-empty")
@@ -56,6 +61,10 @@ def retry_call(
         except Exception as error:
             if attempt == policy.max_attempts or not is_transient(error):
                 raise
+            advised = advised_delay(error) if advised_delay is not None else None
+            if advised is not None:
+                sleep(advised)
+                continue
             base = min(
                 policy.max_delay_seconds,
                 policy.base_delay_seconds * (2 ** (attempt - 1)),
@@ -92,8 +92,11 @@ class SubprocessRunner:
             *(os.fspath(path) for path in path_redactions),
         )
         safe_argv = tuple(redact_text(value, redactions) for value in command)
+        # The allowlist is a handful of names; probe it rather than scanning the whole environ.
         child_environment = {
-            key: value for key, value in os.environ.items() if key in self.allowed_environment
+            key: value
+            for key in self.allowed_environment
+            if (value := os.environ.get(key)) is not None
         }
         child_environment.update(environment or {})
         timeout = self.default_timeout_seconds if timeout_seconds is None else timeout_seconds
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import re
 import tempfile
 from collections.abc import Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 
+from sideloadedipa.util.paths import UNSAFE_PATH_CHARACTERS
+
 
 @dataclass(frozen=True, slots=True)
 class TaskWorkspace:
@@ -20,7 +21,7 @@ class TaskWorkspace:
 
 
 def _safe_prefix(task_name: str) -> str:
-    value = re.sub(r"[^A-Za-z0-9._-]+", "-", task_name).strip(".-")
+    value = UNSAFE_PATH_CHARACTERS.sub("-", task_name).strip(".-")
     return f"{value or 'task'}-"
 
 
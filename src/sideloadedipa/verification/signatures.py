@@ -10,7 +10,6 @@ from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 
-import lief
 from cryptography import x509
 from cryptography.hazmat.primitives.serialization import Encoding
 from pyasn1.codec.der import decoder
@@ -316,6 +315,8 @@ def _verify_executable(
     runner: SubprocessRunner,
     temporary_root: Path,
 ) -> tuple[_SliceSignature, ...]:
+    import lief  # imported lazily alongside the other Mach-O readers
+
     raw = executable.read_bytes()
     parsed = lief.MachO.parse(executable, config=lief.MachO.ParserConfig.quick)
     if parsed is None or parsed.size == 0:
@@ -7,11 +7,20 @@ import zipfile
 from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path, PurePosixPath
-from typing import Callable, Generator
+from typing import Callable
 
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def unqualified_zsign_executables() -> None:
+    """Start every test before any zsign executable has passed its version probe."""
+
+    from sideloadedipa.adapters.signing import zsign
+
+    zsign._QUALIFIED_EXECUTABLES.clear()
+
+
 @pytest.fixture
 def thin_macho_bytes() -> Callable[[], bytes]:
     """Build a minimal arm64 MH_EXECUTE accepted by the production LIEF probe."""
@@ -357,9 +366,19 @@ def production_command(
 
 
 def production_dependencies(tmp_path: Path):  # type: ignore[no-untyped-def]
+    from sideloadedipa.errors import AdapterError, ErrorCode
     from sideloadedipa.pipeline.environment import PipelineEnvironmentDependencies
+    from sideloadedipa.pipeline.inspection import InspectDependencies
     from sideloadedipa.pipeline.production import ProductionPipelineDependencies
 
+    def offline_release(*args, **kwargs):  # type: ignore[no-untyped-def]
+        raise AdapterError(
+            ErrorCode.ADAPTER_RESPONSE_INVALID,
+            "release metadata is not fetched in unit tests",
+            adapter="github-rest",
+            operation="read-release",
+        )
+
     return ProductionPipelineDependencies(
         package=PipelineEnvironmentDependencies(
             output_root=tmp_path / "signed",
@@ -371,6 +390,7 @@ def production_dependencies(tmp_path: Path):  # type: ignore[no-untyped-def]
                 "APPLE_DEV_CERT_P12_ENCODED": "ZmFrZQ==",
                 "APPLE_DEV_CERT_PASSWORD": "secret",
             },
+            inspect=InspectDependencies(fetch_release=offline_release),
         ),
         manifest_root=tmp_path / "pipeline",
         report_root=tmp_path / "reports",
@@ -413,15 +433,3 @@ def production_source_context(tmp_path: Path, task, graph=None):  # type: ignore
         ),
         bundle_graph,
     )
-
-
-@pytest.fixture
-def temp_work_dir(tmp_path: Path) -> Generator[Path, None, None]:
-    """Create a temporary work directory structure."""
-    cache_dir = tmp_path / "work" / "cache"
-    cache_old_dir = tmp_path / "work" / "cache-old"
-    cache_dir.mkdir(parents=True)
-    cache_old_dir.mkdir(parents=True)
-    yield tmp_path
-
-
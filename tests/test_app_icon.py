@@ -114,29 +114,22 @@ class TestResolveIconUrl:
 class TestSniffFormat:
     """Format comes from magic bytes; upstream commits WebP data named .png."""
 
-    def test_png(self) -> None:
-        assert sniff_format(_png()) == "png"
-
-    def test_cgbi_distinguished_from_png(self) -> None:
-        assert sniff_format(_cgbi_png()) == "cgbi"
-
-    def test_webp(self) -> None:
-        assert sniff_format(_webp()) == "webp"
-
-    def test_jpeg(self) -> None:
-        assert sniff_format(b"\xff\xd8\xff\xe0" + b"\x00" * 32) == "jpeg"
-
-    def test_gif(self) -> None:
-        assert sniff_format(b"GIF89a" + b"\x00" * 32) == "gif"
-
-    def test_svg(self) -> None:
-        assert sniff_format(b'<?xml version="1.0"?><svg xmlns="...">') == "svg"
-
-    def test_bare_svg_tag(self) -> None:
-        assert sniff_format(b"  <svg viewBox='0 0 1 1'></svg>") == "svg"
-
-    def test_unknown(self) -> None:
-        assert sniff_format(b"not an image at all") == "unknown"
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            (_png(), "png"),
+            (_cgbi_png(), "cgbi"),
+            (_webp(), "webp"),
+            (b"\xff\xd8\xff\xe0" + b"\x00" * 32, "jpeg"),
+            (b"GIF89a" + b"\x00" * 32, "gif"),
+            (b'<?xml version="1.0"?><svg xmlns="...">', "svg"),
+            (b"  <svg viewBox='0 0 1 1'></svg>", "svg"),
+            (b"not an image at all", "unknown"),
+        ],
+        ids=["png", "cgbi", "webp", "jpeg", "gif", "svg", "bare-svg-tag", "unknown"],
+    )
+    def test_detects_format_from_magic_bytes(self, content: bytes, expected: str) -> None:
+        assert sniff_format(content) == expected
 
 
 # ── CgBI decoding ────────────────────────────────────────────────────────
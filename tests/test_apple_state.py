@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
+import base64
 import hashlib
 import json
-from copy import deepcopy
 from pathlib import Path
 
 import pytest
@@ -18,6 +18,8 @@ from sideloadedipa.domain import FrozenJsonObject, freeze_json
 from sideloadedipa.errors import AdapterError, ErrorCode
 
 FIXTURE = Path(__file__).parent / "fixtures" / "asc" / "apple-state.json"
+# Read once; every test parses its own mutable copy from these bytes.
+FIXTURE_BYTES = FIXTURE.read_bytes()
 
 
 class FixtureClient:
@@ -55,7 +57,7 @@ class FixtureClient:
 
 
 def fixture() -> dict[str, object]:
-    value = json.loads(FIXTURE.read_text())
+    value = json.loads(FIXTURE_BYTES)
     assert isinstance(value, dict)
     return value
 
@@ -124,12 +126,12 @@ def test_collects_sorted_redacted_snapshot_from_one_read_session() -> None:
 
 def test_snapshot_digest_is_independent_of_api_list_order() -> None:
     first_fixture = fixture()
-    second_fixture = deepcopy(first_fixture)
-    bundle_document = second_fixture["bundle_ids"]
+    bundle_document = first_fixture["bundle_ids"]
     assert isinstance(bundle_document, dict)
     bundles = bundle_document["data"]
     assert isinstance(bundles, list)
-    bundles.reverse()
+    # Only the reordered list is new; every other branch is shared read-only.
+    second_fixture = {**first_fixture, "bundle_ids": {**bundle_document, "data": bundles[::-1]}}
 
     first = AppleStateCollector(FixtureClient(first_fixture)).collect()
     second = AppleStateCollector(FixtureClient(second_fixture)).collect()
@@ -168,6 +170,29 @@ def test_scopes_capability_enumeration_to_managed_bundle_identifiers() -> None:
     assert snapshot.capabilities == ()
 
 
+def test_hashes_large_certificate_content_across_decode_chunks() -> None:
+    content = bytes(range(256)) * 1024
+    value = fixture()
+    value["certificates"]["data"][0]["attributes"].update(
+        {"certificateContent": base64.b64encode(content).decode()}
+    )
+
+    snapshot = AppleStateCollector(FixtureClient(value)).collect()
+
+    assert snapshot.certificates[0].certificate_sha256 == hashlib.sha256(content).hexdigest()
+
+
+def test_rejects_certificate_content_padded_before_its_end() -> None:
+    chunk = base64.b64encode(b"x" * 49151).decode()
+    value = fixture()
+    value["certificates"]["data"][0]["attributes"].update({"certificateContent": chunk + chunk})
+
+    with pytest.raises(AdapterError) as caught:
+        AppleStateCollector(FixtureClient(value)).collect()
+
+    assert caught.value.code is ErrorCode.ADAPTER_RESPONSE_INVALID
+
+
 def test_normalizes_paginated_null_data_as_an_empty_list() -> None:
     value = fixture()
     value["profiles"] = {"data": None}
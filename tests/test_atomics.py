@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import errno
 import hashlib
 from pathlib import Path
 
@@ -19,6 +20,28 @@ def test_canonical_json_and_file_digest_are_stable(tmp_path: Path) -> None:
     assert atomics.file_sha256(path) == hashlib.sha256(payload).hexdigest()
 
 
+def test_stat_cached_digest_is_reused_until_the_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "template.plist"
+    path.write_bytes(b"first")
+    calls: list[Path] = []
+    original = atomics.file_sha256
+
+    def counting_sha256(value: Path) -> str:
+        calls.append(value)
+        return original(value)
+
+    monkeypatch.setattr(atomics, "file_sha256", counting_sha256)
+
+    first = atomics.stat_cached_file_sha256(path)
+    assert atomics.stat_cached_file_sha256(path) == first
+    path.write_bytes(b"second, longer")
+
+    assert atomics.stat_cached_file_sha256(path) == hashlib.sha256(b"second, longer").hexdigest()
+    assert len(calls) == 2
+
+
 def test_atomic_write_and_copy_use_private_mode(tmp_path: Path) -> None:
     source = tmp_path / "source"
     destination = tmp_path / "nested" / "destination"
@@ -31,6 +54,89 @@ def test_atomic_write_and_copy_use_private_mode(tmp_path: Path) -> None:
     assert destination.stat().st_mode & 0o777 == 0o600
 
 
+def test_atomic_copy_falls_back_when_sendfile_is_refused(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = tmp_path / "source"
+    destination = tmp_path / "destination"
+    content = bytes(range(256)) * 512
+    atomics.atomic_write_bytes(source, content)
+
+    def refuse(*args: object) -> int:
+        raise OSError(errno.ENOTSOCK, "sendfile needs a socket")
+
+    monkeypatch.setattr(atomics.os, "sendfile", refuse)
+    atomics.atomic_copy(source, destination)
+
+    assert destination.read_bytes() == content
+
+
+def test_atomic_link_shares_the_inode_and_tolerates_existing_links(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    destination = tmp_path / "nested" / "destination"
+    atomics.atomic_write_bytes(source, b"signed")
+
+    atomics.atomic_link(source, destination)
+    atomics.atomic_link(source, destination)
+
+    assert destination.read_bytes() == b"signed"
+    assert destination.stat().st_ino == source.stat().st_ino
+    assert destination.stat().st_mode & 0o777 == 0o600
+    assert list(destination.parent.iterdir()) == [destination]
+
+
+def test_atomic_link_copies_when_hardlinks_are_unavailable(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail_link(source: Path, destination: Path) -> None:
+        del source, destination
+        raise OSError("fixture cross-device link")
+
+    source = tmp_path / "source"
+    destination = tmp_path / "destination"
+    atomics.atomic_write_bytes(source, b"signed")
+    monkeypatch.setattr(atomics.os, "link", fail_link)
+
+    atomics.atomic_link(source, destination)
+
+    assert destination.read_bytes() == b"signed"
+    assert destination.stat().st_ino != source.stat().st_ino
+
+
+def test_atomic_link_copies_instead_of_changing_the_source_mode(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    destination = tmp_path / "destination"
+    atomics.atomic_write_bytes(source, b"cached", mode=0o444)
+
+    atomics.atomic_link(source, destination)
+
+    assert source.stat().st_mode & 0o777 == 0o444
+    assert destination.stat().st_mode & 0o777 == 0o600
+    assert destination.stat().st_ino != source.stat().st_ino
+
+
+def test_atomic_link_uses_a_distinct_temporary_for_every_call(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = tmp_path / "source"
+    destination = tmp_path / "destination"
+    atomics.atomic_write_bytes(source, b"signed")
+    temporaries: list[str] = []
+    link = atomics.os.link
+
+    def record(source: Path, temporary: str) -> None:
+        temporaries.append(temporary)
+        link(source, temporary)
+
+    monkeypatch.setattr(atomics.os, "link", record)
+
+    atomics.atomic_link(source, destination)
+    atomics.atomic_link(source, destination)
+
+    assert len(set(temporaries)) == 2
+    assert destination.stat().st_ino == source.stat().st_ino
+
+
 def test_atomic_write_removes_temporary_file_after_replace_failure(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -94,6 +94,19 @@ def test_cache_index_is_canonical_and_detects_tampering() -> None:
         parse_cache_index_json(json.dumps(document).encode())
 
 
+def test_parsed_cache_index_records_are_task_ordered() -> None:
+    first = fingerprint("First", "a")
+    second = fingerprint("Second", "b")
+    index = build_cache_index((record(second), record(first)))
+    document = json.loads(canonical_cache_index_json(index))
+    document["records"].reverse()
+
+    parsed = parse_cache_index_json(json.dumps(document).encode())
+
+    assert parsed == index
+    assert [value.task_name for value in parsed.records] == ["First", "Second"]
+
+
 def test_duplicate_current_or_cached_tasks_are_rejected() -> None:
     first = fingerprint("First", "a")
 
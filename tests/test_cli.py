@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import io
 import json
+import subprocess
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -139,3 +141,13 @@ def test_default_application_returns_typed_error() -> None:
 
     assert exit_code == 2
     assert json.loads(stderr.getvalue())["code"] == "config.missing"
+
+
+def test_cli_import_defers_the_native_macho_parser() -> None:
+    probe = "import sys, sideloadedipa.cli; print('lief' in sys.modules)"
+
+    result = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, check=True, text=True
+    )
+
+    assert result.stdout.strip() == "False"
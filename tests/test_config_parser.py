@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -453,6 +454,37 @@ def test_reports_missing_and_malformed_files(tmp_path: Path) -> None:
     assert malformed_error.value.code is ErrorCode.CONFIG_INVALID
 
 
+def test_reuses_parsed_configuration_until_the_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "tasks.toml"
+    source = Path("configs/tasks.toml").read_text(encoding="utf-8")
+    path.write_text(source, encoding="utf-8")
+
+    first = load_configuration(path)
+    assert load_configuration(path) is first
+
+    path.write_text(source.replace('app_name = "', 'app_name = "Edited ', 1), encoding="utf-8")
+    edited = load_configuration(path)
+
+    assert edited is not first
+    assert edited.tasks[0].app_name.startswith("Edited ")
+
+
+def test_same_size_edit_within_mtime_granularity_is_parsed_afresh(tmp_path: Path) -> None:
+    path = tmp_path / "tasks.toml"
+    source = Path("configs/tasks.toml").read_text(encoding="utf-8")
+    path.write_text(source, encoding="utf-8")
+    status = path.stat()
+    first = load_configuration(path)
+
+    path.write_text(source.replace('app_name = "', 'app_name = "X', 1)[:-1], encoding="utf-8")
+    os.utime(path, ns=(status.st_atime_ns, status.st_mtime_ns))
+    assert path.stat().st_size == status.st_size
+    edited = load_configuration(path)
+
+    assert edited is not first
+    assert edited.tasks[0].app_name.startswith("X")
+
+
 def test_example_configuration_parses_through_the_production_loader() -> None:
     configuration = load_configuration(Path("configs/tasks.toml.example"))
 
@@ -260,6 +260,17 @@ def test_oracle_signing_order_is_deterministic_and_root_last() -> None:
     assert oracle_signing_order() == ["launch", "process", "share", "root"]
 
 
+def test_zsign_signing_order_reads_only_sign_folder_lines() -> None:
+    output = (
+        ">>> Parsing Files: LiveProcess.appex\n"
+        ">>> SignFolder: ShareExtension.appex\n"
+        ">>> SignFolder: LiveProcess.appex\n"
+        ">>> SignFolder: Qualification.app"
+    )
+
+    assert signing_order(output) == ["share", "process", "root"]
+
+
 def test_zsign_command_uses_four_profiles_without_global_entitlements(tmp_path: Path) -> None:
     command = zsign_command(
         tmp_path / "zsign",
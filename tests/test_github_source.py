@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import gzip
 import json
+import os
+import ssl
+import threading
 from email.message import Message
 from io import BytesIO
 from pathlib import Path
@@ -14,6 +18,7 @@ import pytest
 from sideloadedipa.errors import AdapterError, DomainError, ErrorCode
 from sideloadedipa.sources import (
     GitHubReleaseAsset,
+    GitHubResponseCache,
     fetch_github_release,
 )
 from sideloadedipa.sources import github as github_source
@@ -37,6 +42,12 @@ def asset(name: str, **overrides: object) -> dict[str, object]:
 
 
 class Response(BytesIO):
+    def __init__(self, payload: bytes, headers: dict[str, str] | None = None) -> None:
+        super().__init__(payload)
+        self.headers = Message()
+        for key, value in (headers or {}).items():
+            self.headers[key] = value
+
     def __enter__(self) -> Response:
         return self
 
@@ -54,7 +65,7 @@ def test_fetch_latest_release_uses_current_versioned_github_contract(
         assert timeout == 30
         return Response(json.dumps({"tag_name": "v1", "assets": []}).encode())
 
-    monkeypatch.setattr(github_source, "urlopen", open_request)
+    monkeypatch.setattr(github_source, "_open_api", open_request)
 
     release = fetch_github_release(
         "https://github.com/example/application.git", token="private-token"
@@ -68,6 +79,67 @@ def test_fetch_latest_release_uses_current_versioned_github_contract(
     assert headers["accept"] == "application/vnd.github+json"
     assert headers["x-github-api-version"] == "2026-03-10"
     assert headers["authorization"] == "Bearer private-token"
+    assert headers["accept-encoding"] == "gzip"
+
+
+def test_gzip_encoded_release_is_decoded(monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = gzip.compress(json.dumps({"tag_name": "v1", "assets": []}).encode())
+    monkeypatch.setattr(
+        github_source,
+        "_open_api",
+        lambda request, timeout: Response(payload, {"Content-Encoding": "gzip"}),
+    )
+
+    assert fetch_github_release("https://github.com/example/application")["tag_name"] == "v1"
+
+
+def test_gzip_release_is_capped_after_decoding(monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = gzip.compress(b" " * 4096)
+    assert len(payload) < 64
+    monkeypatch.setattr(github_source, "_MAX_RESPONSE_BYTES", 64)
+    monkeypatch.setattr(
+        github_source,
+        "_open_api",
+        lambda request, timeout: Response(payload, {"Content-Encoding": "gzip"}),
+    )
+
+    with pytest.raises(AdapterError, match="exceeds the configured limit"):
+        fetch_github_release("https://github.com/example/application")
+
+    monkeypatch.setattr(
+        github_source,
+        "_open_api",
+        lambda request, timeout: Response(b"not gzip", {"Content-Encoding": "gzip"}),
+    )
+    with pytest.raises(AdapterError, match="not valid gzip"):
+        fetch_github_release("https://github.com/example/application")
+
+
+def test_oversized_gzip_body_reports_the_limit_and_drops_the_connection(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    payload = gzip.compress(os.urandom(4096))
+    assert len(payload) > 64
+    dropped: list[bool] = []
+    monkeypatch.setattr(github_source, "_MAX_RESPONSE_BYTES", 64)
+    monkeypatch.setattr(github_source, "_drop_api_connection", lambda: dropped.append(True))
+    monkeypatch.setattr(
+        github_source,
+        "_open_api",
+        lambda request, timeout: Response(payload, {"Content-Encoding": "gzip"}),
+    )
+
+    with pytest.raises(AdapterError, match="exceeds the configured limit"):
+        fetch_github_release("https://github.com/example/application")
+    assert dropped == [True]
+
+    monkeypatch.setattr(
+        github_source,
+        "_open_api",
+        lambda request, timeout: Response(gzip.compress(b"{}")[:-4], {"Content-Encoding": "gzip"}),
+    )
+    with pytest.raises(AdapterError, match="not valid gzip"):
+        fetch_github_release("https://github.com/example/application")
 
 
 def test_fetch_prerelease_skips_drafts_and_falls_back_to_published_release(
@@ -80,7 +152,7 @@ def test_fetch_prerelease_skips_drafts_and_falls_back_to_published_release(
     ]
     monkeypatch.setattr(
         github_source,
-        "urlopen",
+        "_open_api",
         lambda request, timeout: Response(json.dumps(releases).encode()),
     )
 
@@ -89,17 +161,202 @@ def test_fetch_prerelease_skips_drafts_and_falls_back_to_published_release(
     assert release["tag_name"] == "preview"
 
 
+def test_unchanged_release_is_revalidated_with_persisted_etag(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    requests: list[Request] = []
+
+    def open_request(request: Request, timeout: float) -> Response:
+        requests.append(request)
+        if request.get_header("If-none-match") == '"v1-etag"':
+            raise HTTPError(request.full_url, 304, "Not Modified", Message(), None)
+        return Response(json.dumps({"tag_name": "v1"}).encode(), {"ETag": '"v1-etag"'})
+
+    monkeypatch.setattr(github_source, "_open_api", open_request)
+    path = tmp_path / "github-releases.json"
+
+    cache = GitHubResponseCache(path)
+    first = fetch_github_release("https://github.com/example/application", cache=cache)
+    cache.flush()
+    second = fetch_github_release(
+        "https://github.com/example/application", cache=GitHubResponseCache(path)
+    )
+
+    assert first == second == {"tag_name": "v1"}
+    assert requests[0].get_header("If-none-match") is None
+    assert requests[1].get_header("If-none-match") == '"v1-etag"'
+
+
+def test_release_cache_persists_only_fields_the_package_reads(tmp_path: Path) -> None:
+    path = tmp_path / "github-releases.json"
+    release = {
+        "tag_name": "v1",
+        "body": "long release notes",
+        "author": {"login": "maintainer"},
+        "assets": [asset("App.ipa", uploader={"login": "maintainer"}, digest=None)],
+    }
+
+    cache = GitHubResponseCache(path)
+    cache.store("https://api.github.com/releases/latest", '"e"', release)
+    cache.flush()
+
+    cached = GitHubResponseCache(path).lookup("https://api.github.com/releases/latest")
+    assert cached is not None
+    assert cached[1] == {"tag_name": "v1", "assets": [asset("App.ipa", digest=None)]}
+    assert select_release_asset(cached[1], "*.ipa").name == "App.ipa"  # type: ignore[arg-type]
+
+
+def test_release_cache_writes_once_per_flush(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    writes: list[Path] = []
+    original = github_source.atomic_write_bytes
+
+    def record(path: Path, payload: bytes) -> None:
+        writes.append(path)
+        original(path, payload)
+
+    monkeypatch.setattr(github_source, "atomic_write_bytes", record)
+    path = tmp_path / "github-releases.json"
+    cache = GitHubResponseCache(path)
+
+    cache.store("https://api.github.com/repos/example/first/releases/latest", '"a"', {})
+    cache.store("https://api.github.com/repos/example/second/releases/latest", '"b"', {})
+    assert not path.exists()
+    cache.flush()
+    cache.flush()
+
+    assert writes == [path]
+    reloaded = GitHubResponseCache(path)
+    assert reloaded.lookup("https://api.github.com/repos/example/first/releases/latest") == (
+        '"a"',
+        {},
+    )
+    assert reloaded.lookup("https://api.github.com/repos/example/second/releases/latest") == (
+        '"b"',
+        {},
+    )
+
+
+def test_prerelease_lookup_reads_one_small_page_then_falls_back_to_latest(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    page = [{"tag_name": f"v{index}", "draft": False, "prerelease": False} for index in range(10)]
+    requested: list[str] = []
+
+    def open_request(request: Request, timeout: float) -> Response:
+        requested.append(request.full_url)
+        if request.full_url.endswith("/latest"):
+            return Response(json.dumps({"tag_name": "v0"}).encode())
+        return Response(json.dumps(page).encode())
+
+    monkeypatch.setattr(github_source, "_open_api", open_request)
+
+    release = fetch_github_release("https://github.com/example/application", use_prerelease=True)
+
+    assert release["tag_name"] == "v0"
+    assert requested == [
+        "https://api.github.com/repos/example/application/releases?per_page=10",
+        "https://api.github.com/repos/example/application/releases/latest",
+    ]
+
+
+def test_api_requests_reuse_one_keep_alive_connection_per_thread(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    connections: list[FakeConnection] = []
+
+    class FakeConnection:
+        def __init__(self, host: str, *, timeout: float, context: ssl.SSLContext) -> None:
+            assert host == "api.github.com"
+            assert context is github_source._TLS_CONTEXT
+            self.timeout = timeout
+            self.requests: list[tuple[str, str]] = []
+            connections.append(self)
+
+        def request(self, method: str, target: str, *, headers: dict[str, str]) -> None:
+            assert headers["User-agent"] == "SideloadedIPA/1"
+            self.requests.append((method, target))
+
+        def getresponse(self) -> Response:
+            response = Response(json.dumps({"tag_name": "v1"}).encode())
+            response.status = 200  # type: ignore[attr-defined]
+            return response
+
+        def close(self) -> None:
+            pass
+
+    monkeypatch.setattr(github_source, "HTTPSConnection", FakeConnection)
+    monkeypatch.setattr(github_source, "_CONNECTIONS", threading.local())
+
+    fetch_github_release("https://github.com/example/first")
+    fetch_github_release("https://github.com/example/second", use_prerelease=False)
+
+    assert len(connections) == 1
+    assert connections[0].requests == [
+        ("GET", "/repos/example/first/releases/latest"),
+        ("GET", "/repos/example/second/releases/latest"),
+    ]
+
+
+def test_connections_opened_on_worker_threads_are_closed_explicitly(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    closed: list[object] = []
+
+    class FakeConnection:
+        def __init__(self, host: str, *, timeout: float, context: ssl.SSLContext) -> None:
+            self.timeout = timeout
+
+        def close(self) -> None:
+            closed.append(self)
+
+    monkeypatch.setattr(github_source, "HTTPSConnection", FakeConnection)
+    monkeypatch.setattr(github_source, "_CONNECTIONS", threading.local())
+    monkeypatch.setattr(github_source, "_OPEN_CONNECTIONS", set())
+    opened: list[object] = []
+
+    def open_connection() -> None:
+        opened.append(github_source._api_connection(30))
+
+    workers = [threading.Thread(target=open_connection) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    github_source.close_api_connections()
+    github_source.close_api_connections()
+
+    assert len(opened) == 2
+    assert sorted(map(id, closed)) == sorted(map(id, opened))
+
+
+def test_repository_name_is_memoized_per_url() -> None:
+    github_repository_name.cache_clear()
+
+    assert github_repository_name("https://github.com/example/cached") == "example/cached"
+    assert github_repository_name("https://github.com/example/cached") == "example/cached"
+
+    info = github_repository_name.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
 def test_repository_name_and_adapter_failures_are_safe(monkeypatch: pytest.MonkeyPatch) -> None:
     assert (
         github_repository_name("https://github.com/example/application/") == "example/application"
     )
+    assert github_repository_name("https://github.com/example/app.git") == "example/app"
+    assert github_repository_name("https://github.com/example/app?tab=readme") == "example/app"
+    assert github_repository_name("https://GitHub.com:443/example/app") == "example/app"
     with pytest.raises(DomainError):
         github_repository_name("https://example.com/example/application")
 
     def fail(request: Request, timeout: float) -> Response:
         raise HTTPError(request.full_url, 403, "secret body", Message(), None)
 
-    monkeypatch.setattr(github_source, "urlopen", fail)
+    monkeypatch.setattr(github_source, "_open_api", fail)
     with pytest.raises(AdapterError) as caught:
         fetch_github_release("https://github.com/example/application", token="private-token")
 
@@ -111,6 +368,125 @@ def test_repository_name_and_adapter_failures_are_safe(monkeypatch: pytest.Monke
     assert "private-token" not in str(caught.value)
 
 
+def throttled(request: Request, status: int, **headers: str) -> HTTPError:
+    message = Message()
+    for key, value in headers.items():
+        message[key.replace("_", "-")] = value
+    return HTTPError(request.full_url, status, "throttled", message, None)
+
+
+def test_secondary_rate_limit_waits_for_retry_after(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+    delays: list[float] = []
+
+    def open_request(request: Request, timeout: float) -> Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise throttled(request, 403, Retry_After="7")
+        return Response(json.dumps({"tag_name": "v1", "assets": []}).encode())
+
+    monkeypatch.setattr(github_source, "_open_api", open_request)
+
+    release = fetch_github_release("https://github.com/example/app", sleep=delays.append)
+
+    assert release["tag_name"] == "v1"
+    assert calls == 2
+    assert delays == [7.0]
+
+
+def test_long_primary_rate_limit_reset_fails_without_waiting(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = 0
+    delays: list[float] = []
+
+    def open_request(request: Request, timeout: float) -> Response:
+        nonlocal calls
+        calls += 1
+        raise throttled(request, 403, X_RateLimit_Remaining="0", X_RateLimit_Reset="9999999999")
+
+    monkeypatch.setattr(github_source, "_open_api", open_request)
+
+    with pytest.raises(AdapterError) as caught:
+        fetch_github_release("https://github.com/example/app", sleep=delays.append)
+
+    assert ("status", 403) in caught.value.safe_details
+    assert calls == 1
+    assert delays == []
+
+
+def test_low_remaining_budget_spreads_requests_over_the_reset_window(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class FakeConnection:
+        def __init__(self, host: str, *, timeout: float, context: ssl.SSLContext) -> None:
+            self.timeout = timeout
+
+        def request(self, method: str, target: str, *, headers: dict[str, str]) -> None:
+            pass
+
+        def getresponse(self) -> Response:
+            response = Response(
+                json.dumps({"tag_name": "v1"}).encode(),
+                {
+                    "X-RateLimit-Limit": "5000",
+                    "X-RateLimit-Remaining": "10",
+                    "X-RateLimit-Reset": "1100",
+                },
+            )
+            response.status = 200  # type: ignore[attr-defined]
+            return response
+
+        def close(self) -> None:
+            pass
+
+    delays: list[float] = []
+    monkeypatch.setattr(github_source, "HTTPSConnection", FakeConnection)
+    monkeypatch.setattr(github_source, "_CONNECTIONS", threading.local())
+    monkeypatch.setattr(github_source, "_RATE_LIMIT", github_source._RateLimitBudget())
+
+    for repository in ("first", "second"):
+        fetch_github_release(
+            f"https://github.com/example/{repository}",
+            clock=lambda: 1000.0,
+            sleep=delays.append,
+        )
+
+    assert delays == [10.0]
+    plenty = github_source._RateLimitBudget(limit=5000, remaining=500, reset_at=1100)
+    exhausted = github_source._RateLimitBudget(limit=5000, remaining=0, reset_at=9999)
+    assert plenty.reserve(1000) == 0
+    assert exhausted.reserve(1000) == 60
+
+
+def test_unauthenticated_quota_is_not_paced_until_nearly_spent() -> None:
+    budget = github_source._RateLimitBudget(limit=60, remaining=59, reset_at=4500)
+
+    assert budget.reserve(1000) == 0
+
+    budget.remaining = 5
+    assert budget.reserve(1000) == 60
+
+
+def test_concurrent_callers_are_given_consecutive_slots() -> None:
+    budget = github_source._RateLimitBudget(limit=5000, remaining=10, reset_at=1100)
+
+    assert [budget.reserve(1000) for _ in range(3)] == [10.0, 20.0, 30.0]
+    assert budget.reserve(1025) == 12.5
+
+
+def test_callers_beyond_the_remaining_quota_fail_instead_of_queueing() -> None:
+    budget = github_source._RateLimitBudget(limit=60, remaining=3, reset_at=1030)
+
+    assert [budget.reserve(1000) for _ in range(3)] == [10.0, 20.0, 30.0]
+    with pytest.raises(AdapterError) as caught:
+        budget.reserve(1000)
+
+    assert caught.value.code is ErrorCode.ADAPTER_RATE_LIMITED
+    assert budget.next_slot == 1030
+
+
 def test_selects_one_asset_and_records_complete_evidence() -> None:
     digest = f"sha256:{'A' * 64}"
     selected = select_release_asset(
@@ -133,6 +509,18 @@ def test_selects_one_asset_and_records_complete_evidence() -> None:
     )
 
 
+def test_release_glob_is_compiled_once_per_pattern() -> None:
+    github_source._glob_matcher.cache_clear()
+    release = {"assets": [asset("App.ipa"), asset("notes.txt")]}
+
+    assert select_release_asset(release, "*.ipa").name == "App.ipa"
+    assert select_release_asset(release, "*.ipa").name == "App.ipa"
+    assert select_release_asset(release, "*.txt").name == "notes.txt"
+
+    info = github_source._glob_matcher.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
 def test_five_production_audits_remain_unambiguous_with_default_glob() -> None:
     audit = json.loads((FIXTURES / "production-release-audit.json").read_text())
 
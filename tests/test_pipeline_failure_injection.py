@@ -100,8 +100,8 @@ def test_failure_blocks_every_downstream_production_stage_and_side_effect(
         lambda path: TaskConfiguration((task,)),
     )
 
-    def resolve_source(selected, value):  # type: ignore[no-untyped-def]
-        del value
+    def resolve_source(selected, value, release):  # type: ignore[no-untyped-def]
+        del value, release
         path = pipeline._source_path(selected, task)
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_bytes(context.downloaded.path.read_bytes())
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import base64
 import hashlib
 import json
 import signal
+import threading
+import time
 from contextlib import contextmanager
 from dataclasses import replace
 from datetime import datetime, timedelta, timezone
@@ -13,6 +16,7 @@ from types import SimpleNamespace
 
 import pytest
 
+import sideloadedipa.pipeline.inspection as inspection
 import sideloadedipa.pipeline.production as production
 import sideloadedipa.pipeline.publish_stage as publish_stage
 import sideloadedipa.pipeline.sign_stage as sign_stage
@@ -37,17 +41,18 @@ from sideloadedipa.domain import (
     StageStatus,
     TaskConfiguration,
 )
-from sideloadedipa.errors import ConfigurationError, DomainError
+from sideloadedipa.errors import AdapterError, ConfigurationError, DomainError, ErrorCode
 from sideloadedipa.ipa.metadata import IpaMetadata
 from sideloadedipa.pipeline.cancellation import SideEffectJournal
-from sideloadedipa.pipeline.environment import PipelineEnvironmentDependencies
-from sideloadedipa.pipeline.inspection import InspectDependencies, ResolvedSource
+from sideloadedipa.pipeline.environment import PipelineEnvironmentDependencies, decode_p12
+from sideloadedipa.pipeline.inspection import InspectDependencies, ResolvedSource, fetch_releases
 from sideloadedipa.pipeline.production import (
     PreparedContext,
     ProductionPipeline,
     ProductionPipelineDependencies,
     SourceContext,
 )
+from sideloadedipa.pipeline.stages.evidence import StageEvidence
 from sideloadedipa.signing.preflight import PreflightResult
 from sideloadedipa.sources import DownloadedSource
 from sideloadedipa.util import atomics
@@ -87,6 +92,15 @@ def command(
     )
 
 
+def offline_release(*args, **kwargs):  # type: ignore[no-untyped-def]
+    raise AdapterError(
+        ErrorCode.ADAPTER_RESPONSE_INVALID,
+        "release metadata is not fetched in unit tests",
+        adapter="github-rest",
+        operation="read-release",
+    )
+
+
 def dependencies(tmp_path: Path) -> ProductionPipelineDependencies:
     environment = {
         "ZSIGN_BIN": str(tmp_path / "zsign"),
@@ -100,6 +114,7 @@ def dependencies(tmp_path: Path) -> ProductionPipelineDependencies:
             cache_root=tmp_path / "cache",
             profile_root=tmp_path / "profiles",
             environment=environment,
+            inspect=InspectDependencies(fetch_release=offline_release),
         ),
         manifest_root=tmp_path / "pipeline",
         report_root=tmp_path / "reports",
@@ -237,7 +252,9 @@ def test_preflight_aggregates_all_tasks_before_apple_calls(tmp_path: Path, monke
     monkeypatch.setattr(
         pipeline,
         "_resolve_source_asset",
-        lambda request, task: materialize_source(pipeline, request, contexts[task.task_name]),
+        lambda request, task, release: materialize_source(
+            pipeline, request, contexts[task.task_name]
+        ),
     )
     monkeypatch.setattr(
         source_inventory_stage,
@@ -286,7 +303,7 @@ def test_source_failure_is_retained_as_preflight_evidence(tmp_path: Path, monkey
         lambda path: TaskConfiguration((task,)),
     )
 
-    def fail_source(request, selected):  # type: ignore[no-untyped-def]
+    def fail_source(request, selected, release):  # type: ignore[no-untyped-def]
         raise DomainError(
             production.ErrorCode.SOURCE_DOWNLOAD_FAILED,
             "fixture source failure",
@@ -344,7 +361,7 @@ def test_source_intake_errors_stop_inventory_and_later_side_effects(
         lambda path: TaskConfiguration((task,)),
     )
 
-    def fail_source(request, selected):  # type: ignore[no-untyped-def]
+    def fail_source(request, selected, release):  # type: ignore[no-untyped-def]
         raise DomainError(code, "fixture bounded source failure", task_name=selected.task_name)
 
     monkeypatch.setattr(pipeline, "_resolve_source_asset", fail_source)
@@ -386,7 +403,7 @@ def test_visible_commands_extend_one_valid_manifest_chain(tmp_path: Path, monkey
         lambda path: TaskConfiguration((task,)),
     )
 
-    def resolve_source(request, selected):  # type: ignore[no-untyped-def]
+    def resolve_source(request, selected, release):  # type: ignore[no-untyped-def]
         return materialize_source(pipeline, request, context)
 
     monkeypatch.setattr(pipeline, "_resolve_source_asset", resolve_source)
@@ -438,6 +455,105 @@ def test_visible_commands_extend_one_valid_manifest_chain(tmp_path: Path, monkey
     )
 
 
+def test_next_sources_download_while_current_task_is_inventoried(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tasks = load_configuration(Path("configs/tasks.toml")).tasks[:3]
+    first = tasks[0]
+    pipeline = ProductionPipeline(dependencies(tmp_path))
+    contexts = {task.task_name: source_context(tmp_path, task) for task in tasks}
+    monkeypatch.setattr(
+        production,
+        "load_configuration",
+        lambda path: TaskConfiguration(tasks),
+    )
+    resolved: list[str] = []
+    started = {task.task_name: threading.Event() for task in tasks}
+
+    def resolve_source(request, selected, release):  # type: ignore[no-untyped-def]
+        resolved.append(selected.task_name)
+        started[selected.task_name].set()
+        return materialize_source(pipeline, request, contexts[selected.task_name])
+
+    overlapped: list[bool] = []
+
+    def inspect_graph(path, *, source_sha256, task):  # type: ignore[no-untyped-def]
+        if task.task_name == first.task_name:
+            overlapped.extend(started[other.task_name].wait(timeout=5) for other in tasks[1:])
+        return contexts[task.task_name].graph
+
+    monkeypatch.setattr(pipeline, "_resolve_source_asset", resolve_source)
+    monkeypatch.setattr(source_inventory_stage, "inspect_source_graph", inspect_graph)
+    monkeypatch.setattr(
+        source_inventory_stage,
+        "validate_signing_preflight",
+        lambda *args, **kwargs: PreflightResult(()),
+    )
+
+    request = command(tmp_path, CommandName.INSPECT)
+    pipeline.inspect(request)
+
+    assert sorted(resolved) == sorted(task.task_name for task in tasks)
+    assert resolved[0] == first.task_name
+    assert overlapped == [True, True]
+    windows = [
+        {stage.stage: stage for stage in pipeline._store(request).completed(task.task_name)}
+        for task in tasks
+    ]
+    for previous, current in zip(windows, windows[1:]):
+        inventory = previous[PipelineStage.INVENTORY]
+        assert inventory.completed_at is not None
+        assert current[PipelineStage.SOURCE].started_at >= inventory.completed_at
+
+
+def test_release_metadata_is_fetched_before_any_source_window_and_passed_explicitly(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tasks = [
+        task
+        for task in load_configuration(Path("configs/tasks.toml")).tasks
+        if task.source.kind is SourceKind.GITHUB_RELEASE
+    ][:2]
+    events: list[str] = []
+
+    def fetch_release(location, **kwargs):  # type: ignore[no-untyped-def]
+        events.append(f"fetch:{location}")
+        return {"tag_name": location}
+
+    package = replace(
+        dependencies(tmp_path).package,
+        inspect=InspectDependencies(fetch_release=fetch_release),
+    )
+    pipeline = ProductionPipeline(replace(dependencies(tmp_path), package=package))
+    contexts = {task.task_name: source_context(tmp_path, task) for task in tasks}
+    monkeypatch.setattr(production, "load_configuration", lambda path: TaskConfiguration(tasks))
+    received: dict[str, object] = {}
+
+    def resolve_source(request, selected, release):  # type: ignore[no-untyped-def]
+        events.append(f"resolve:{selected.task_name}")
+        received[selected.task_name] = release
+        return materialize_source(pipeline, request, contexts[selected.task_name])
+
+    monkeypatch.setattr(pipeline, "_resolve_source_asset", resolve_source)
+    monkeypatch.setattr(
+        source_inventory_stage,
+        "inspect_source_graph",
+        lambda path, *, source_sha256, task: contexts[task.task_name].graph,
+    )
+    monkeypatch.setattr(
+        source_inventory_stage,
+        "validate_signing_preflight",
+        lambda *args, **kwargs: PreflightResult(()),
+    )
+
+    pipeline.inspect(command(tmp_path, CommandName.INSPECT))
+
+    fetches = [event for event in events if event.startswith("fetch:")]
+    assert len(fetches) == len({task.source.location for task in tasks})
+    assert events[: len(fetches)] == fetches
+    assert received == {task.task_name: {"tag_name": task.source.location} for task in tasks}
+
+
 @pytest.mark.parametrize("mutation", ["missing", "truncated", "source-tampered"])
 def test_invalid_canonical_inputs_stop_downstream_side_effects(
     mutation: str,
@@ -455,7 +571,7 @@ def test_invalid_canonical_inputs_stop_downstream_side_effects(
     monkeypatch.setattr(
         pipeline,
         "_resolve_source_asset",
-        lambda request, selected: materialize_source(pipeline, request, context),
+        lambda request, selected, release: materialize_source(pipeline, request, context),
     )
     monkeypatch.setattr(
         source_inventory_stage,
@@ -646,6 +762,91 @@ def test_unchanged_direct_source_cache_hit_reopens_artifact_without_resigning(
     assert backend.called is True
 
 
+def test_signing_failure_stops_submitting_and_discards_in_flight_cache_writes(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    tasks = load_configuration(Path("configs/tasks.toml")).tasks[:3]
+    contexts: list[SourceContext] = []
+    prepared: list[PreparedContext] = []
+    for task in tasks:
+        signing_request = request_for(task, tmp_path)
+        context = SourceContext(
+            task,
+            ResolvedSource("https://example.invalid/source.ipa", None, {}, None),
+            DownloadedSource(
+                signing_request.source_ipa,
+                signing_request.source_ipa.stat().st_size,
+                signing_request.graph.source_sha256,
+            ),
+            SourceAsset(
+                "asset",
+                signing_request.source_ipa.name,
+                "https://example.invalid/source.ipa",
+                "v1",
+                NOW,
+                PurePosixPath(signing_request.source_ipa.name),
+                signing_request.graph.source_sha256,
+            ),
+            signing_request.graph,
+        )
+        fingerprint = SigningCacheFingerprint(
+            1, task.task_name, (("task", task.task_name),), "a" * 64
+        )
+        contexts.append(context)
+        prepared.append(PreparedContext(context, signing_request, fingerprint))
+    pipeline = ProductionPipeline(dependencies(tmp_path))
+    monkeypatch.setattr(production, "load_configuration", lambda path: TaskConfiguration(tasks))
+    monkeypatch.setattr(
+        pipeline, "_load_contexts", lambda request, configuration=None: tuple(contexts)
+    )
+
+    @contextmanager
+    def prepared_contexts(request, contexts):  # type: ignore[no-untyped-def]
+        yield tuple(prepared)
+
+    monkeypatch.setattr(pipeline, "_prepared", prepared_contexts)
+    failed = threading.Event()
+    signed: list[str] = []
+
+    def sign_prepared(self, request, value, decision, record):  # type: ignore[no-untyped-def]
+        task_name = value.source.task.task_name
+        signed.append(task_name)
+        if task_name != tasks[0].task_name:
+            # Still signing when the main thread fails; its cache write lands afterwards.
+            failed.wait(timeout=5)
+            time.sleep(0.1)
+            artifact = self.cache().artifact_path(task_name, value.fingerprint.sha256)
+            artifact.parent.mkdir(parents=True, exist_ok=True)
+            artifact.write_bytes(b"signed")
+        assert decision.rebuild
+        return decision, "f" * 64, "0" * 64, NOW, NOW
+
+    original_record_success = StageEvidence.record_success
+
+    def record_success(self, store, task_name, stage, *args, **kwargs):  # type: ignore[no-untyped-def]
+        if stage is PipelineStage.SIGN:
+            failed.set()
+            raise DomainError(ErrorCode.PIPELINE_TRANSITION_INVALID, "evidence write failed")
+        return original_record_success(self, store, task_name, stage, *args, **kwargs)
+
+    monkeypatch.setattr(production_signing_stage, "SIGNING_WORKERS", 2)
+    monkeypatch.setattr(production_signing_stage.SigningStage, "_sign_prepared", sign_prepared)
+    monkeypatch.setattr(StageEvidence, "record_success", record_success)
+    request = command(tmp_path, CommandName.SIGN, *(task.task_name for task in tasks))
+    for context in contexts:
+        _prime_apply_stages(pipeline, request, context)
+
+    with pytest.raises(DomainError, match="evidence write failed"):
+        pipeline.sign(request)
+
+    store = pipeline._store(request)
+    assert sorted(signed) == sorted(task.task_name for task in tasks[:2])
+    assert store.load(tasks[1].task_name, PipelineStage.SIGNING_PLAN) is not None
+    assert store.load(tasks[2].task_name, PipelineStage.SIGNING_PLAN) is None
+    assert not pipeline._signing.cache().artifact_path(tasks[1].task_name, "a" * 64).exists()
+
+
 def test_default_stage_wrapper_records_created_resources_on_cancellation(
     tmp_path: Path,
     monkeypatch,
@@ -1157,6 +1358,104 @@ def test_source_resolution_persists_current_asset_for_the_run(tmp_path: Path, mo
     assert pipeline._source_selection_path(request, task).is_file()
 
 
+def test_later_run_restores_verified_source_without_downloading(tmp_path: Path) -> None:
+    content = b"reviewed direct IPA"
+    digest = hashlib.sha256(content).hexdigest()
+    configured = load_configuration(Path("configs/tasks.toml")).tasks[0]
+    task = replace(
+        configured,
+        source=SourceConfig(
+            SourceKind.DIRECT_URL,
+            "https://downloads.example/App.ipa",
+            ipa_sha256=digest,
+        ),
+    )
+    downloads = 0
+
+    def download(  # type: ignore[no-untyped-def]
+        url, destination, *, expected_sha256, expected_size
+    ):
+        nonlocal downloads
+        downloads += 1
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_bytes(content)
+        return DownloadedSource(destination, len(content), digest)
+
+    package = replace(
+        dependencies(tmp_path).package,
+        inspect=InspectDependencies(download=download),
+    )
+    pipeline = ProductionPipeline(replace(dependencies(tmp_path), package=package))
+
+    first = pipeline._resolve_source_asset(
+        command(tmp_path, CommandName.INSPECT, task.task_name), task
+    )
+    second = pipeline._resolve_source_asset(
+        command(tmp_path, CommandName.INSPECT, task.task_name, run_id="run-two"), task
+    )
+
+    assert downloads == 1
+    assert second[1].path != first[1].path
+    assert second[1].path.read_bytes() == content
+    assert second[1].sha256 == first[1].sha256 == digest
+    assert second[2] == first[2]
+
+
+def test_later_run_restores_undigested_release_asset_by_identity(tmp_path: Path) -> None:
+    content = b"release asset without a published digest"
+    task = next(
+        task
+        for task in load_configuration(Path("configs/tasks.toml")).tasks
+        if task.source.kind is SourceKind.GITHUB_RELEASE
+    )
+    release = {
+        "tag_name": "v1",
+        "assets": [
+            {
+                "id": 7,
+                "name": task.source.release_glob or "App.ipa",
+                "browser_download_url": "https://github.example/App.ipa",
+                "size": len(content),
+            }
+        ],
+    }
+    downloads = 0
+
+    def download(  # type: ignore[no-untyped-def]
+        url, destination, *, expected_sha256, expected_size
+    ):
+        nonlocal downloads
+        downloads += 1
+        assert expected_sha256 is None
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_bytes(content)
+        return DownloadedSource(destination, len(content), hashlib.sha256(content).hexdigest())
+
+    package = replace(
+        dependencies(tmp_path).package,
+        inspect=InspectDependencies(
+            fetch_release=lambda *args, **kwargs: release,
+            download=download,
+        ),
+    )
+    pipeline = ProductionPipeline(replace(dependencies(tmp_path), package=package))
+
+    first = pipeline._resolve_source_asset(
+        command(tmp_path, CommandName.INSPECT, task.task_name), task
+    )
+    second = pipeline._resolve_source_asset(
+        command(tmp_path, CommandName.INSPECT, task.task_name, run_id="run-two"), task
+    )
+    release["assets"][0]["id"] = 8  # type: ignore[index]
+    pipeline._resolve_source_asset(
+        command(tmp_path, CommandName.INSPECT, task.task_name, run_id="run-three"), task
+    )
+
+    assert downloads == 2
+    assert second[1].path.read_bytes() == content
+    assert second[1].sha256 == first[1].sha256
+
+
 def test_direct_source_digest_flows_through_download_and_canonical_evidence(
     tmp_path: Path,
 ) -> None:
@@ -1198,6 +1497,92 @@ def test_direct_source_digest_flows_through_download_and_canonical_evidence(
     assert resolved.evidence["actual_sha256"] == digest
 
 
+def test_release_metadata_is_fetched_concurrently_with_per_task_failures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    closed: list[bool] = []
+    monkeypatch.setattr(inspection, "close_api_connections", lambda: closed.append(True))
+    tasks = load_configuration(Path("configs/tasks.toml")).tasks[:3]
+    barrier = threading.Barrier(len(tasks), timeout=5)
+    failing = tasks[1].source.location
+
+    def fetch_release(repository_url, **options):  # type: ignore[no-untyped-def]
+        token = options["token"]
+        assert token == "token"
+        barrier.wait()
+        if repository_url == failing:
+            raise AdapterError(
+                ErrorCode.ADAPTER_RESPONSE_INVALID,
+                "release metadata could not be decoded",
+                adapter="github-rest",
+                operation="read-release",
+            )
+        return {"tag_name": repository_url}
+
+    results = fetch_releases(tasks, InspectDependencies(fetch_release=fetch_release), "token")
+
+    assert list(results) == [task.task_name for task in tasks]
+    assert results[tasks[0].task_name] == {"tag_name": tasks[0].source.location}
+    assert isinstance(results[tasks[1].task_name], AdapterError)
+    assert results[tasks[2].task_name] == {"tag_name": tasks[2].source.location}
+    assert closed == [True]
+
+
+def test_release_metadata_fetches_respect_the_worker_bound() -> None:
+    base = load_configuration(Path("configs/tasks.toml")).tasks[0]
+    tasks = tuple(
+        replace(
+            base,
+            task_name=f"Task{index}",
+            source=replace(base.source, location=f"https://github.com/example/app{index}"),
+        )
+        for index in range(6)
+    )
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def fetch_release(repository_url, **options):  # type: ignore[no-untyped-def]
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return {"tag_name": repository_url}
+
+    results = fetch_releases(
+        tasks, InspectDependencies(fetch_release=fetch_release), None, max_workers=2
+    )
+
+    assert len(results) == len(tasks)
+    assert peak <= 2
+
+
+def test_tasks_sharing_a_release_channel_share_one_metadata_request() -> None:
+    task = load_configuration(Path("configs/tasks.toml")).tasks[0]
+    tasks = (
+        task,
+        replace(task, task_name="Mirror", slug="mirror"),
+        replace(task, task_name="Preview", source=replace(task.source, use_prerelease=True)),
+    )
+    calls: list[tuple[str, bool]] = []
+
+    def fetch_release(repository_url, **options):  # type: ignore[no-untyped-def]
+        calls.append((repository_url, options["use_prerelease"]))
+        return {"tag_name": "prerelease" if options["use_prerelease"] else "stable"}
+
+    results = fetch_releases(tasks, InspectDependencies(fetch_release=fetch_release), None)
+
+    assert sorted(calls) == [(task.source.location, False), (task.source.location, True)]
+    assert results == {
+        task.task_name: {"tag_name": "stable"},
+        "Mirror": {"tag_name": "stable"},
+        "Preview": {"tag_name": "prerelease"},
+    }
+
+
 def test_prepared_context_builds_private_signing_inputs_and_complete_fingerprint(
     tmp_path: Path,
     monkeypatch,
@@ -1249,3 +1634,24 @@ def test_prepared_context_builds_private_signing_inputs_and_complete_fingerprint
     template_digests = sign_stage.template_digests(livecontainer, Path.cwd())
     assert len(template_digests) == 2
     assert len({path for path, _ in template_digests}) == 1
+
+
+def test_p12_secret_is_decoded_in_chunks_to_an_owner_only_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    content = bytes(range(256)) * 50
+    environment = {
+        "APPLE_DEV_CERT_P12_ENCODED": base64.b64encode(content).decode(),
+        "APPLE_DEV_CERT_PASSWORD": "secret",
+    }
+    monkeypatch.setattr("sideloadedipa.pipeline.environment._P12_DECODE_CHUNK", 16)
+    destination = tmp_path / "certificate.p12"
+
+    assert decode_p12(environment, destination) == "secret"
+    assert destination.read_bytes() == content
+    assert destination.stat().st_mode & 0o777 == 0o600
+
+    padded = base64.b64encode(b"ab").decode() + base64.b64encode(content).decode()
+    with pytest.raises(ConfigurationError, match="not valid base64"):
+        decode_p12({**environment, "APPLE_DEV_CERT_P12_ENCODED": padded}, destination)
+    assert not destination.exists()
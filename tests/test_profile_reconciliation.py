@@ -196,6 +196,17 @@ def test_reuses_best_fully_valid_profile_without_creating_or_deleting() -> None:
     assert not hasattr(gateway, "delete")
 
 
+def test_matches_profile_devices_regardless_of_request_device_order() -> None:
+    existing = state("PROFILE_EXISTING", "LiveContainer Dev", b"valid-existing")
+    gateway = FakeGateway((existing,), {existing.resource_id: b"valid-existing"})
+    request = replace(sync_request(), device_resource_ids=tuple(reversed(DEVICE_RESOURCE_IDS)))
+
+    result = ProfileReconciler(gateway, FakeValidator()).ensure(request)
+
+    assert result.profile.resource_id == "PROFILE_EXISTING"
+    assert gateway.create_calls == []
+
+
 def test_reuses_supplied_profile_snapshot_without_relisting_account() -> None:
     existing = state("PROFILE_EXISTING", "LiveContainer Dev", b"valid-existing")
     gateway = FakeGateway(
@@ -112,6 +112,25 @@ def test_stores_profiles_and_manifest_atomically_with_private_permissions(tmp_pa
     assert not list(tmp_path.rglob(".tmp-*"))
 
 
+def test_storing_identical_profile_content_leaves_the_file_in_place(tmp_path: Path) -> None:
+    relative_path, _digest = store_profile(
+        tmp_path, task_name="Example", target_bundle_id="io.example.app", content=b"profile"
+    )
+    stored = tmp_path.joinpath(*relative_path.parts)
+    inode = stored.stat().st_ino
+
+    store_profile(
+        tmp_path, task_name="Example", target_bundle_id="io.example.app", content=b"profile"
+    )
+    assert stored.stat().st_ino == inode
+    store_profile(
+        tmp_path, task_name="Example", target_bundle_id="io.example.app", content=b"renewed"
+    )
+
+    assert stored.read_bytes() == b"renewed"
+    assert stored.stat().st_mode & 0o777 == 0o600
+
+
 def test_loads_only_an_authenticated_task_manifest(tmp_path: Path) -> None:
     task_name = "Live Container"
     manifest = build_profile_manifest(
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import hashlib
+import threading
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from pathlib import Path, PurePosixPath
 
 import pytest
 
+import sideloadedipa.pipeline.publication as publication
 from sideloadedipa.domain import (
     BatchPublicationPolicy,
     BundleNodeKind,
@@ -27,10 +29,10 @@ from sideloadedipa.verification import build_verification_result, required_verif
 NOW = datetime(2026, 7, 21, tzinfo=timezone.utc)
 
 
-def signing_plan() -> SigningPlan:
+def signing_plan(task_name: str = "Example") -> SigningPlan:
     values = normalize_entitlements({"application-identifier": "TEAM.io.example.app"})
     return SigningPlan(
-        "Example",
+        task_name,
         "0" * 64,
         "1" * 64,
         "2" * 64,
@@ -53,9 +55,9 @@ def signing_plan() -> SigningPlan:
     )
 
 
-def candidate(artifact: Path) -> PublicationCandidate:
+def candidate(artifact: Path, task_name: str = "Example") -> PublicationCandidate:
     digest = hashlib.sha256(artifact.read_bytes()).hexdigest()
-    plan = signing_plan()
+    plan = signing_plan(task_name)
     verification = build_verification_result(
         plan,
         digest,
@@ -65,8 +67,8 @@ def candidate(artifact: Path) -> PublicationCandidate:
         ),
     )
     return PublicationCandidate(
-        "Example",
-        "example",
+        task_name,
+        task_name.lower(),
         "Example",
         "io.example.app",
         "1.2.3",
@@ -314,3 +316,46 @@ def test_cleanup_failure_reports_every_ipa_and_icon_key(tmp_path: Path) -> None:
         "apps/example/1.2.3/Example.ipa",
         "apps/example/icon.png",
     )
+
+
+def test_batch_uploads_run_concurrently_and_failure_discards_sibling_uploads(
+    tmp_path: Path,
+) -> None:
+    artifact = tmp_path / "Example.ipa"
+    artifact.write_bytes(b"verified")
+    values = (candidate(artifact), candidate(artifact, "Second"))
+    gateway = RecordingGateway()
+    original = gateway.upload_artifact
+    barrier = threading.Barrier(len(values), timeout=5)
+
+    def upload(value: PublicationCandidate) -> StoredArtifact:
+        barrier.wait()
+        if value.task_name == "Example":
+            raise OSError("injected upload failure")
+        return original(value)
+
+    gateway.upload_artifact = upload  # type: ignore[method-assign]
+
+    with pytest.raises(DomainError, match="immutable artifact upload failed") as caught:
+        VerifiedPublicationService(gateway).publish(values, now=NOW)
+
+    assert caught.value.task_name == "Example"
+    assert gateway.calls == ["read", "upload", "delete-uploaded"]
+    assert "apps/second/1.2.3/Example.ipa" in gateway.deleted_uploaded
+
+
+def test_no_upload_starts_after_the_first_upload_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    artifact = tmp_path / "Example.ipa"
+    artifact.write_bytes(b"verified")
+    values = (candidate(artifact), candidate(artifact, "Second"), candidate(artifact, "Third"))
+    gateway = RecordingGateway(fail_at="upload")
+    monkeypatch.setattr(publication, "PUBLICATION_UPLOAD_WORKERS", 1)
+
+    with pytest.raises(DomainError, match="immutable artifact upload failed") as caught:
+        VerifiedPublicationService(gateway).publish(values, now=NOW)
+
+    assert caught.value.task_name == "Example"
+    assert gateway.calls == ["read", "upload", "delete-uploaded"]
+    assert gateway.deleted_uploaded == ("apps/example/icon.png",)
@@ -41,6 +41,13 @@ class FakeR2Store:
         self.objects[key] = path.read_bytes()
         return f"{self.public_base_url}/{key}"
 
+    def object_size(self, key: str) -> int | None:
+        value = self.objects.get(key)
+        return None if value is None else len(value)
+
+    def public_url(self, key: str) -> str:
+        return f"{self.public_base_url}/{key}"
+
     def download_bytes(self, key: str) -> bytes:
         return self.objects[key]
 
@@ -99,6 +106,23 @@ def test_content_addressed_upload_retries_with_same_key(tmp_path: Path) -> None:
     assert tuple(store.objects) == (stored.key,)
 
 
+def test_unchanged_artifact_is_confirmed_without_reuploading(tmp_path: Path) -> None:
+    artifact = tmp_path / "Example.ipa"
+    artifact.write_bytes(b"verified")
+    value = candidate(artifact)
+    store = FakeR2Store()
+    adapter = gateway(store)
+
+    first = adapter.upload_artifact(value)
+    second = adapter.upload_artifact(value)
+    store.objects[first.key] = b"tampered"
+    third = adapter.upload_artifact(value)
+
+    assert second == first == third
+    assert store.upload_attempts == 2
+    assert store.objects[first.key] == b"verified"
+
+
 def test_adapter_delegates_registry_revalidation_and_cleanup() -> None:
     store = FakeR2Store()
     adapter = gateway(store)
@@ -13,6 +13,7 @@ from botocore.response import StreamingBody
 from botocore.stub import ANY, Stubber
 
 from sideloadedipa.adapters.publication.r2_store import (
+    DELETE_BATCH_LIMIT,
     ICON_CACHE_CONTROL,
     ICON_CONTENT_TYPE,
     IPA_CACHE_CONTROL,
@@ -74,7 +75,7 @@ class TestFromEnv:
         monkeypatch.setenv("R2_BUCKET", "bucket")
         monkeypatch.setenv("R2_PUBLIC_BASE_URL", "https://ipa.example.com/")
         monkeypatch.delenv("R2_REGION", raising=False)
-        with patch("sideloadedipa.adapters.publication.r2_store.boto3.client") as mock_client:
+        with patch("boto3.client") as mock_client:
             store = R2Store.from_env()
         assert store.bucket == "bucket"
         # trailing slash stripped
@@ -97,7 +98,7 @@ class TestFromEnv:
         monkeypatch.setenv("R2_BUCKET", "bucket")
         monkeypatch.setenv("R2_PUBLIC_BASE_URL", "https://ipa.example.com")
         monkeypatch.setenv("R2_REGION", "apac")
-        with patch("sideloadedipa.adapters.publication.r2_store.boto3.client") as mock_client:
+        with patch("boto3.client") as mock_client:
             R2Store.from_env()
         assert mock_client.call_args.kwargs["region_name"] == "apac"
 
@@ -182,9 +183,8 @@ class TestUploadAndDownloadJson:
     def test_download_json_parses_body(self) -> None:
         client = MagicMock()
         payload = {"updatedAt": None, "apps": []}
-        client.get_object.return_value = {
-            "Body": MagicMock(read=lambda: json.dumps(payload).encode())
-        }
+        body = json.dumps(payload).encode()
+        client.get_object.return_value = {"Body": StreamingBody(io.BytesIO(body), len(body))}
         store = _store(client)
         assert store.download_json("site/apps.json") == payload
 
@@ -298,6 +298,35 @@ class TestCleanupStale:
         assert store.cleanup_stale(["ehpanda"], referenced) == []
         client.delete_objects.assert_not_called()
 
+    def test_stale_keys_of_all_slugs_are_deleted_in_one_batch(self) -> None:
+        client = MagicMock()
+        paginator = MagicMock()
+        paginator.paginate.side_effect = [
+            [{"Contents": [{"Key": "apps/ehpanda/2.7.3/EhPanda.ipa"}]}],
+            [{"Contents": [{"Key": "apps/jhentai/8.0/JHenTai.ipa"}]}],
+        ]
+        client.get_paginator.return_value = paginator
+        store = _store(client)
+
+        deleted = store.cleanup_stale(["ehpanda", "jhentai"], set())
+
+        assert deleted == ["apps/ehpanda/2.7.3/EhPanda.ipa", "apps/jhentai/8.0/JHenTai.ipa"]
+        client.delete_objects.assert_called_once_with(
+            Bucket="zeroclover-ipa",
+            Delete={"Objects": [{"Key": key} for key in deleted]},
+        )
+
+    def test_large_deletions_are_split_at_the_api_limit(self) -> None:
+        client = MagicMock()
+        store = _store(client)
+
+        store.delete_keys([f"apps/example/{index}.ipa" for index in range(DELETE_BATCH_LIMIT + 1)])
+
+        batches = [
+            call.kwargs["Delete"]["Objects"] for call in client.delete_objects.call_args_list
+        ]
+        assert [len(batch) for batch in batches] == [DELETE_BATCH_LIMIT, 1]
+
     def test_only_requested_slugs_scanned(self) -> None:
         """Manual apps are never touched: only the given slugs get listed."""
         client = MagicMock()
@@ -369,6 +398,26 @@ class TestUploadIcon:
 class TestStubbedR2Contracts:
     """Exercise the real botocore request layer without network access."""
 
+    def test_object_size_reads_head_and_treats_missing_keys_as_absent(self) -> None:
+        store, stubber = _stubbed_store()
+        key = "apps/example/1.0/Example.ipa"
+        stubber.add_response(
+            "head_object",
+            {"ContentLength": 8},
+            {"Bucket": "zeroclover-ipa", "Key": key},
+        )
+        stubber.add_client_error(
+            "head_object",
+            service_error_code="404",
+            http_status_code=404,
+            expected_params={"Bucket": "zeroclover-ipa", "Key": key},
+        )
+
+        with stubber:
+            assert store.object_size(key) == 8
+            assert store.object_size(key) is None
+        stubber.assert_no_pending_responses()
+
     def test_upload_confirmation_reads_back_exact_bytes(self, tmp_path: Path) -> None:
         store, stubber = _stubbed_store()
         artifact = tmp_path / "Example.ipa"
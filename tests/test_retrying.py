@@ -37,6 +37,32 @@ def test_safe_retry_is_bounded_with_exponential_jitter() -> None:
     assert delays == [1, 2]
 
 
+def test_advised_delay_replaces_backoff_when_present() -> None:
+    calls = 0
+    delays: list[float] = []
+
+    def action() -> str:
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            raise OSError("throttled" if calls == 1 else "transient")
+        return "ok"
+
+    result = retry_call(
+        operation_id="read:releases",
+        operation=RetryOperation.READ,
+        action=action,
+        is_transient=lambda error: isinstance(error, OSError),
+        policy=RetryPolicy(base_delay_seconds=1, max_delay_seconds=4),
+        sleep=delays.append,
+        random_unit=lambda: 0.5,
+        advised_delay=lambda error: 30.0 if str(error) == "throttled" else None,
+    )
+
+    assert result == "ok"
+    assert delays == [30.0, 2]
+
+
 def test_non_transient_failure_is_not_retried() -> None:
     calls = 0
 
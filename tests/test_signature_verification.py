@@ -9,6 +9,7 @@ import tempfile
 import zipfile
 from dataclasses import replace
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path, PurePosixPath
 from typing import Any
 
@@ -38,8 +39,14 @@ from sideloadedipa.verification.artifact import SignedArtifactEntitlementEvidenc
 from sideloadedipa.verification.service import PackageVerifier, VerificationChecks
 
 
-def certificate() -> tuple[rsa.RSAPrivateKey, x509.Certificate, str]:
-    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+@lru_cache(maxsize=None)
+def signing_key(slot: int) -> rsa.RSAPrivateKey:
+    # RSA generation dominates these tests; each distinct identity needs only its own key.
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def certificate(slot: int = 0) -> tuple[rsa.RSAPrivateKey, x509.Certificate, str]:
+    key = signing_key(slot)
     name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "Signature Fixture")])
     now = datetime.now(timezone.utc)
     cert = (
@@ -444,7 +451,7 @@ def test_nested_tamper_fails_both_child_signature_and_parent_seal(tmp_path: Path
 
 def test_rejects_unintended_identity_ad_hoc_and_unsealed_content(tmp_path: Path) -> None:
     key, cert, digest = certificate()
-    _, _, other_digest = certificate()
+    _, _, other_digest = certificate(slot=1)
     identity_findings = verify_artifact_signatures(
         signing_plan(other_digest),
         signed_ipa(tmp_path, key, cert),
@@ -6,7 +6,9 @@ import hashlib
 import plistlib
 import shutil
 import stat
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path, PurePosixPath
@@ -297,6 +299,40 @@ def test_rejects_backend_result_contract_mismatches(tmp_path: Path, mismatch: st
     assert not (tmp_path / ".sideloadedipa-signing").exists()
 
 
+def test_concurrent_signings_share_and_then_remove_the_workspace_base(tmp_path: Path) -> None:
+    both_signing = threading.Barrier(2, timeout=5)
+
+    class OverlappingBackend(CopyingBackend):
+        def sign(
+            self,
+            plan: SigningPlan,
+            source: Path,
+            output: Path,
+            material: CertificateMaterial,
+        ) -> SigningResult:
+            both_signing.wait()
+            return super().sign(plan, source, output, material)
+
+    def sign(name: str) -> bytes:
+        source = tmp_path / f"{name}.source.ipa"
+        source_ipa(source)
+        destination = tmp_path / f"{name}.ipa"
+        execute_signing_plan(
+            plan=plan_for(source),
+            source_ipa=source,
+            destination_ipa=destination,
+            certificate=certificate(tmp_path),
+            backend=OverlappingBackend(),
+        )
+        return destination.read_bytes()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        outputs = list(executor.map(sign, ("first", "second")))
+
+    assert all(output.startswith(b"PK") for output in outputs)
+    assert not (tmp_path / ".sideloadedipa-signing").exists()
+
+
 def test_rejects_identical_source_and_destination(tmp_path: Path) -> None:
     source = tmp_path / "downloaded.ipa"
     source_ipa(source)
@@ -311,6 +347,22 @@ def test_rejects_identical_source_and_destination(tmp_path: Path) -> None:
         )
 
 
+def test_rejects_destination_that_links_to_the_source(tmp_path: Path) -> None:
+    source = tmp_path / "downloaded.ipa"
+    source_ipa(source)
+    destination = tmp_path / "signed.ipa"
+    destination.hardlink_to(source)
+
+    with pytest.raises(DomainError, match="must be different"):
+        execute_signing_plan(
+            plan=plan_for(source),
+            source_ipa=source,
+            destination_ipa=destination,
+            certificate=certificate(tmp_path),
+            backend=CopyingBackend(),
+        )
+
+
 def test_packaging_rejects_symbolic_links(tmp_path: Path) -> None:
     workspace = tmp_path / "workspace"
     workspace.mkdir()
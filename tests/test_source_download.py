@@ -3,17 +3,24 @@
 from __future__ import annotations
 
 import hashlib
+import ssl
 import stat
 from email.message import Message
 from pathlib import Path
 from types import TracebackType
 from urllib.error import HTTPError, URLError
-from urllib.request import Request
+from urllib.request import HTTPSHandler, Request
 
 import pytest
 
+import sideloadedipa.sources.download as download_module
 from sideloadedipa.errors import AdapterError, DomainError, ErrorCode
-from sideloadedipa.sources import DownloadPolicy, download_source_asset
+from sideloadedipa.sources import (
+    DownloadedSource,
+    DownloadPolicy,
+    SourceArtifactCache,
+    download_source_asset,
+)
 
 
 class FakeResponse:
@@ -392,3 +399,88 @@ def test_retryable_http_failure_reuses_selected_url(tmp_path: Path) -> None:
         "https://example.com/App.ipa",
         "https://example.com/App.ipa",
     ]
+
+
+def cached_source(cache: SourceArtifactCache, tmp_path: Path, content: bytes) -> str:
+    digest = hashlib.sha256(content).hexdigest()
+    downloaded = tmp_path / "run-one" / "source.ipa"
+    downloaded.parent.mkdir(parents=True)
+    downloaded.write_bytes(content)
+    cache.store("App", DownloadedSource(downloaded, len(content), digest))
+    return digest
+
+
+def test_source_cache_restores_verified_copy_by_digest(tmp_path: Path) -> None:
+    cache = SourceArtifactCache(tmp_path / "cache")
+    digest = cached_source(cache, tmp_path, b"cached IPA bytes")
+    destination = tmp_path / "run-two" / "source.ipa"
+
+    restored = cache.restore(
+        "App",
+        destination,
+        expected_sha256=f"sha256:{digest}",
+        expected_size=16,
+        policy=policy(),
+    )
+
+    assert restored == DownloadedSource(destination, 16, digest)
+    assert destination.read_bytes() == b"cached IPA bytes"
+    assert stat.S_IMODE(destination.stat().st_mode) == 0o444
+    assert cache.restore("Other", tmp_path / "other.ipa", expected_sha256=digest) is None
+    assert cache.restore("App", tmp_path / "unknown.ipa", expected_sha256=None) is None
+    assert (
+        cache.restore("App", tmp_path / "short.ipa", expected_sha256=digest, expected_size=3)
+        is None
+    )
+
+
+def test_source_cache_discards_corrupted_entries(tmp_path: Path) -> None:
+    cache = SourceArtifactCache(tmp_path / "cache")
+    digest = cached_source(cache, tmp_path, b"cached IPA bytes")
+    entry = cache.artifact_path("App", digest)
+    entry.unlink()
+    entry.write_bytes(b"tampered IPA byte")
+    destination = tmp_path / "run-two" / "source.ipa"
+
+    assert cache.restore("App", destination, expected_sha256=digest, policy=policy()) is None
+    assert not destination.exists()
+    assert not entry.exists()
+
+
+def test_source_cache_keeps_only_the_latest_source_per_task(tmp_path: Path) -> None:
+    cache = SourceArtifactCache(tmp_path / "cache")
+    previous = cached_source(cache, tmp_path / "first", b"release one")
+    current = cached_source(cache, tmp_path / "second", b"release two")
+
+    assert not cache.artifact_path("App", previous).exists()
+    assert cache.artifact_path("App", current).read_bytes() == b"release two"
+    assert list(cache.artifact_path("App", current).parent.iterdir()) == [
+        cache.artifact_path("App", current)
+    ]
+
+
+def test_source_cache_learns_digests_for_undigested_asset_identities(tmp_path: Path) -> None:
+    cache = SourceArtifactCache(tmp_path / "cache")
+    content = b"undigested release"
+    downloaded = tmp_path / "run-one" / "source.ipa"
+    downloaded.parent.mkdir(parents=True)
+    downloaded.write_bytes(content)
+    digest = hashlib.sha256(content).hexdigest()
+
+    cache.store("App", DownloadedSource(downloaded, len(content), digest), identity="asset#7:18")
+
+    assert cache.learned_digest("App", "asset#7:18") == digest
+    assert cache.learned_digest("App", "asset#8:18") is None
+    assert cache.learned_digest("Other", "asset#7:18") is None
+    cached_source(cache, tmp_path / "second", b"digested release")
+    assert cache.learned_digest("App", "asset#7:18") is None
+
+
+def test_downloads_share_one_verifying_tls_context() -> None:
+    handlers = [
+        handler for handler in download_module._OPENER.handlers if isinstance(handler, HTTPSHandler)
+    ]
+
+    assert [handler._context for handler in handlers] == [download_module._TLS_CONTEXT]
+    assert download_module._TLS_CONTEXT.verify_mode is ssl.CERT_REQUIRED
+    assert download_module._TLS_CONTEXT.check_hostname
@@ -134,6 +134,10 @@ def test_cache_is_versioned_and_saved_only_after_successful_signing() -> None:
     )[0]
     assert "if: ${{ success() }}" in save_cache
     assert "always()" not in save_cache
+    restore_cache = signing.split("- name: Restore cache", maxsplit=1)[1].split(
+        "- name: ", maxsplit=1
+    )[0]
+    assert "if: ${{ env.FORCE_REBUILD != 'true' && env.FORCE_REBUILD != '1' }}" in restore_cache
 
 
 def test_production_apple_sync_records_plan_and_apply_in_one_cli_transaction() -> None:
@@ -384,6 +384,36 @@ def test_rejects_incomplete_or_changed_plan_evidence(tmp_path: Path, mutation: s
     assert caught.value.code is ErrorCode.SIGNING_PLAN_INVALID
 
 
+def test_version_probe_runs_once_per_verified_executable(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    executable_path = executable(tmp_path)
+    probes: list[tuple[str, ...]] = []
+    first, second = backend(tmp_path, executable_path), backend(tmp_path, executable_path)
+    original = first.runner.run
+
+    def run(argv, **options):  # type: ignore[no-untyped-def]
+        probes.append(tuple(str(value) for value in argv))
+        return original(argv, **options)
+
+    monkeypatch.setattr(first.runner, "run", run)
+    monkeypatch.setattr(second.runner, "run", run)
+
+    assert first.identity() == second.identity()
+    assert probes == [(str(executable_path), "-v")]
+
+    executable_path.write_text(executable_path.read_text() + "# rebuilt\n")
+    stale = ZsignBackend(
+        executable=executable_path,
+        expected_executable_sha256=second.expected_executable_sha256,
+        profile_root=tmp_path / "profiles",
+    )
+    with pytest.raises(AdapterError) as caught:
+        stale.identity()
+    assert caught.value.code is ErrorCode.ADAPTER_VERSION_MISMATCH
+
+
 def test_missing_backend_executable_has_typed_error(tmp_path: Path) -> None:
     adapter = ZsignBackend(
         executable=tmp_path / "missing-zsign",